@@ -10,112 +10,110 @@ This script generates a token-optimized JSON format that:
 - Focuses on essential classification features only
 """
 
+import argparse
 import sqlite3
-import json
 import os
+import gzip
+import importlib
+import itertools
+import operator
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
 
+import orjson
+
+# Handle imports for both direct execution and module import
+try:
+    from scripts.utils.export_io import dumps_ascii
+except ModuleNotFoundError:
+    from utils.export_io import dumps_ascii
+
+# Rarities that never make a coin a key date. Anything else that is set
+# (key, semi-key, scarce, unique, ...) is listed under key_dates.
+NON_KEY_DATE_RARITIES = frozenset({'common'})
+
+# Optional binary encodings: format -> (module, file suffix). The codecs are
+# only imported when requested (uv sync --extra binary).
+BINARY_FORMATS = {
+    "cbor": ("cbor2", ".cbor"),
+    "msgpack": ("msgpack", ".msgpack"),
+}
+
 class AITaxonomyExporter:
-    def __init__(self, db_path="database/coins.db", output_dir="data/ai-optimized", use_year_lists=True):
+    def __init__(self, db_path="database/coins.db", output_dir="data/ai-optimized", use_year_lists=True,
+                 write_gzip=False, binary_format=None):
+        if binary_format is not None and binary_format not in BINARY_FORMATS:
+            raise ValueError(f"Unknown binary format {binary_format!r}; expected one of {sorted(BINARY_FORMATS)}")
+
         self.db_path = db_path
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
         self.use_year_lists = use_year_lists  # Toggle: True = comma-delimited years, False = full coin IDs
+        self.write_gzip = write_gzip  # Also emit <name>.json.gz next to the plain file (--gzip)
+        self.binary_format = binary_format  # Optional "cbor"/"msgpack" copy for binary-capable consumers
         
     def extract_type_code(self, coin_id):
         """Extract 4-letter type code from coin_id (US-INCH-1877-P -> INCH)"""
-        try:
-            parts = coin_id.split('-')
-            if len(parts) >= 4:
-                return parts[1]  # TYPE code is second part
-            return None
-        except:
+        if not isinstance(coin_id, str):
             return None
+
+        parts = coin_id.split('-', 3)
+        return parts[1] if len(parts) >= 4 else None  # TYPE code is second part
     
     def process_varieties(self, varieties_json):
         """Convert varieties JSON to simple array of variety names"""
         if not varieties_json:
             return None
         
-        try:
-            varieties = json.loads(varieties_json) if isinstance(varieties_json, str) else varieties_json
-            if not varieties or len(varieties) == 0:
+        if isinstance(varieties_json, (str, bytes)):
+            try:
+                varieties = orjson.loads(varieties_json)
+            except ValueError:
                 return None
-                
-            # Extract just the variety names, not full objects
-            variety_names = []
-            for variety in varieties:
-                if isinstance(variety, dict) and 'name' in variety:
-                    variety_names.append(variety['name'])
-                elif isinstance(variety, str):
-                    variety_names.append(variety)
-            
-            return variety_names if variety_names else None
-        except:
+        else:
+            varieties = varieties_json
+
+        if not varieties or not isinstance(varieties, (list, dict)):
             return None
+
+        # Extract just the variety names, not full objects
+        variety_names = []
+        for variety in varieties:
+            if isinstance(variety, dict) and 'name' in variety:
+                variety_names.append(variety['name'])
+            elif isinstance(variety, str):
+                variety_names.append(variety)
+
+        return variety_names if variety_names else None
     
-    def get_series_year_ranges(self, cursor):
-        """Get year ranges for each series, preferring series_registry over derived MIN/MAX.
+    def resolve_year_range(self, registry_start, registry_end, coins_min, coins_max):
+        """Resolve a series year range, preferring series_registry over derived MIN/MAX.
 
         Priority:
         1. Use series_registry.start_year/end_year when available (prefer numeric over XXXX)
-        2. Fall back to MIN/MAX of coins table (excluding XXXX years)
+        2. Fall back to MIN/MAX of the series' coins (excluding XXXX years)
 
         This allows sparse series (with only seed coins) to still export full year ranges.
         """
-        # Use subquery to get best registry entry (prefer numeric start_year over XXXX)
-        query = """
-        SELECT
-            c.series as series_id,
-            best_sr.start_year as registry_start,
-            best_sr.end_year as registry_end,
-            MIN(CASE WHEN c.year != 'XXXX' THEN CAST(c.year AS INTEGER) END) as coins_min_year,
-            MAX(CASE WHEN c.year != 'XXXX' THEN CAST(c.year AS INTEGER) END) as coins_max_year,
-            COUNT(DISTINCT CASE WHEN c.year != 'XXXX' THEN c.year END) as actual_years,
-            GROUP_CONCAT(DISTINCT c.year ORDER BY c.year) as existing_years
-        FROM coins c
-        LEFT JOIN (
-            SELECT series_name,
-                   MIN(CASE WHEN start_year != 'XXXX' THEN start_year END) as start_year,
-                   MIN(CASE WHEN end_year != 'XXXX' THEN end_year END) as end_year
-            FROM series_registry
-            GROUP BY series_name
-        ) best_sr ON c.series = best_sr.series_name
-        GROUP BY c.series
-        """
-        cursor.execute(query)
-        series_ranges = {}
-
-        for row in cursor.fetchall():
-            series_id, registry_start, registry_end, coins_min, coins_max, actual_years, existing_years = row
-
-            # Prefer series_registry values, fall back to derived MIN/MAX
-            start_year = registry_start if registry_start is not None else coins_min
-            end_year = registry_end if registry_end is not None else coins_max
-
-            # Handle ongoing series (null end_year in registry) - use coins max or current year
-            if registry_start is not None and registry_end is None:
-                # Ongoing series: use 2024 as reasonable end year for AI taxonomy
-                end_year = max(coins_max or 2024, 2024)
+        # Prefer series_registry values, fall back to derived MIN/MAX
+        start_year = registry_start if registry_start is not None else coins_min
+        end_year = registry_end if registry_end is not None else coins_max
 
-            series_ranges[series_id] = {
-                'start_year': start_year,
-                'end_year': end_year,
-                'actual_years': actual_years or 0,
-                'existing_years': existing_years.split(',') if existing_years else [],
-                'from_registry': registry_start is not None
-            }
+        # Handle ongoing series (null end_year in registry) - use coins max or current year
+        if registry_start is not None and registry_end is None:
+            # Ongoing series: use 2024 as reasonable end year for AI taxonomy
+            end_year = max(coins_max or 2024, 2024)
 
-        return series_ranges
+        return start_year, end_year
 
     def generate_complete_year_list(self, start_year, end_year):
         """Generate comma-delimited string of all years in range"""
         if not start_year or not end_year:
             return None
         
-        years = list(range(int(start_year), int(end_year) + 1))
-        return ','.join(map(str, years))
+        return ','.join(map(str, range(int(start_year), int(end_year) + 1)))
     
     def generate_complete_coin_ids(self, series_id, start_year, end_year, type_code):
         """Generate complete list of coin IDs for all year/mint combinations"""
@@ -137,93 +135,135 @@ class AITaxonomyExporter:
         else:  # Early era - mainly Philadelphia
             mint_marks = ['P']
         
-        # Generate all combinations
-        coin_ids = []
-        for year in range(int(start_year), int(end_year) + 1):
-            for mint in mint_marks:
-                coin_id = f"US-{type_code}-{year}-{mint}"
-                coin_ids.append(coin_id)
-        
-        return ','.join(coin_ids)
+        # Generate all combinations; format each "US-TYPE-YEAR-" head once and
+        # only append the mint mark per combination
+        year_heads = [f"US-{type_code}-{year}-" for year in range(int(start_year), int(end_year) + 1)]
+        return ','.join([head + mint for head in year_heads for mint in mint_marks])
 
-    def export_ai_taxonomy(self):
-        """Export AI-optimized taxonomy with complete year coverage"""
-        print("🤖 Exporting AI-optimized taxonomy with complete year coverage...")
-        
+    def build_series_data(self):
+        """Read the coins table once and assemble format-independent series data.
+
+        Each entry splits the series record around its coverage field
+        (years or coin_ids) so any output format can be rendered from it:
+        - head: series, s, t, year_range, total_years
+        - tail: optional ob, rv, df, kw, cn, key_dates, v fields
+        - start_year, end_year, type_code, is_xxxx_only for rendering coverage
+        """
         # Connect to database
         conn = sqlite3.connect(self.db_path)
+        # Read-only workload: mmap the database file, use a 64 MiB page cache
+        # and keep temp b-trees (ORDER BY sorts) in memory. journal_mode and
+        # synchronous only affect writers, so they are left at their defaults.
+        conn.executescript("""
+            PRAGMA temp_store=MEMORY;
+            PRAGMA mmap_size=268435456;
+            PRAGMA cache_size=-65536;
+        """)
         cursor = conn.cursor()
         
-        # Get series year ranges first  
-        series_ranges = self.get_series_year_ranges(cursor)
-        
         # Query essential fields including visual descriptions, grouped by series
-        # Map actual database columns to expected names
+        # Map actual database columns to expected names. The best registry entry
+        # per series (prefer numeric start_year over XXXX) rides along on every
+        # row so year ranges need no second pass over the coins table.
         query = """
         SELECT 
-            series as series_id,
-            series as series_name,
-            coin_id,
+            c.series as series_id,
+            c.coin_id,
+            c.year,
+            c.variety as varieties,
+            c.obverse_description,
+            c.reverse_description,
+            '' as distinguishing_features,
+            '' as identification_keywords,
+            '' as common_names,
+            best_sr.start_year as registry_start,
+            best_sr.end_year as registry_end
+        FROM coins c
+        LEFT JOIN (
+            SELECT series_name,
+                   MIN(CASE WHEN start_year != 'XXXX' THEN start_year END) as start_year,
+                   MIN(CASE WHEN end_year != 'XXXX' THEN end_year END) as end_year
+            FROM series_registry
+            GROUP BY series_name
+        ) best_sr ON c.series = best_sr.series_name
+        ORDER BY c.series, c.year
+        """
+        
+        # Key dates (non-common rarities) are a small slice of the table, so let
+        # SQLite filter them instead of checking every coin in Python
+        rarity_params = sorted(NON_KEY_DATE_RARITIES)
+        key_dates_query = f"""
+        SELECT
+            series,
             year,
             mint,
             rarity,
-            variety as varieties,
-            notes,
-            obverse_description,
-            reverse_description,
-            '' as distinguishing_features,
-            '' as identification_keywords,
-            '' as common_names
+            CASE WHEN length(notes) > 50 THEN substr(notes, 1, 50) || '...' ELSE notes END as short_notes
         FROM coins
+        WHERE rarity IS NOT NULL AND rarity <> '' AND rarity NOT IN ({','.join('?' * len(rarity_params))})
         ORDER BY series, year
         """
         
-        cursor.execute(query)
-        rows = cursor.fetchall()
-        
-        # Group coins by series for processing
-        series_data = {}
-        for row in rows:
-            series_id, series_name, coin_id, year, mint, rarity, varieties, notes, obverse_desc, reverse_desc, features, keywords, names = row
-            
-            if series_id not in series_data:
-                series_data[series_id] = {
-                    'series_name': series_name,
-                    'coins': [],
-                    'prototype_coin': None  # We'll use first coin as template
+        cursor.execute(key_dates_query, rarity_params)
+        key_dates_by_series = {}
+        for series_id, rows in itertools.groupby(cursor, key=operator.itemgetter(0)):
+            # Mints and rarities come from a handful of values; intern them so
+            # every key date shares one string object instead of a fresh copy
+            # per sqlite row
+            key_dates_by_series[series_id] = [
+                {
+                    'year': year,
+                    'mint': sys.intern(mint), 
+                    'rarity': sys.intern(rarity),
+                    'notes': short_notes
                 }
-            
-            coin_record = {
-                'coin_id': coin_id, 'year': year, 'mint': mint, 'rarity': rarity,
-                'varieties': varieties, 'notes': notes, 'obverse_desc': obverse_desc,
-                'reverse_desc': reverse_desc, 'features': features, 
-                'keywords': keywords, 'names': names
-            }
-            
-            series_data[series_id]['coins'].append(coin_record)
-            
-            # Use first coin as prototype for series
-            if series_data[series_id]['prototype_coin'] is None:
-                series_data[series_id]['prototype_coin'] = coin_record
-        
-        # Process each series and create series-level records with complete year coverage
-        series_records = []
-        total_coins_represented = 0
+                for _, year, mint, rarity, short_notes in rows
+            ]
         
-        for series_id, data in series_data.items():
-            prototype = data['prototype_coin']
-            series_name = data['series_name']
-            
-            # Get year range for this series
-            year_range = series_ranges.get(series_id, {})
-            start_year = year_range.get('start_year')
-            end_year = year_range.get('end_year')
+        cursor.execute(query)
+
+        # Stream rows straight off the cursor; the query is ordered by series,
+        # so each series arrives as one contiguous group.
+        series_data = []
+
+        for series_id, rows in itertools.groupby(cursor, key=operator.itemgetter(0)):
+            # Use first coin as prototype for series
+            prototype = next(rows)
+            (_, prototype_coin_id, _, _,
+             obverse_desc, reverse_desc, features, keywords, names,
+             registry_start, registry_end) = prototype
 
             # Extract type code from prototype first
-            type_code = self.extract_type_code(prototype['coin_id'])
+            type_code = self.extract_type_code(prototype_coin_id)
             if not type_code:
                 continue
 
+            key_dates = key_dates_by_series.get(series_id)
+
+            # Collect varieties and the coins' own MIN/MAX year in a single
+            # pass (rows are ordered by year, with XXXX sorting last)
+            all_varieties = set()
+            first_year = last_year = None
+            
+            for (_, _, year, varieties,
+                 _, _, _, _, _, _, _) in itertools.chain((prototype,), rows):
+                if year != 'XXXX':
+                    if first_year is None:
+                        first_year = year
+                    last_year = year
+
+                # Collect varieties
+                if varieties:
+                    variety_names = self.process_varieties(varieties)
+                    if variety_names:
+                        all_varieties.update(variety_names)
+
+            # Get year range for this series; only the first and last numeric
+            # years are needed, so convert just those two
+            coins_min = int(first_year) if first_year is not None else None
+            coins_max = int(last_year) if last_year is not None else None
+            start_year, end_year = self.resolve_year_range(registry_start, registry_end, coins_min, coins_max)
+
             # Handle XXXX-only series (bullion random year)
             is_xxxx_only = (start_year is None and end_year is None) or \
                            (str(start_year) == 'XXXX' or str(end_year) == 'XXXX')
@@ -246,97 +286,176 @@ class AITaxonomyExporter:
             # Create series record using prototype coin as template
             series_record = {
                 "series": series_id,
-                "s": series_name,
+                "s": series_id,  # series_name is the same column; share the object
                 "t": type_code,
                 "year_range": year_range_str,
                 "total_years": total_years
             }
-            
-            # Choose approach based on configuration
-            if is_xxxx_only:
-                # Bullion series with random year - include without year list
-                series_record["years"] = "XXXX"
-            elif self.use_year_lists:
-                # APPROACH 1: Comma-delimited year list (more efficient)
-                complete_years = self.generate_complete_year_list(start_year, end_year)
-                if complete_years:
-                    series_record["years"] = complete_years
-                else:
-                    continue
-            else:
-                # APPROACH 2: Complete coin ID list (comprehensive but verbose)
-                complete_coin_ids = self.generate_complete_coin_ids(series_id, start_year, end_year, type_code)
-                if complete_coin_ids:
-                    series_record["coin_ids"] = complete_coin_ids  # Complete coin ID coverage
-                else:
-                    continue
+            details = {}
             
             # Add visual descriptions from prototype (these should be consistent across series)
-            if prototype['obverse_desc'] and len(prototype['obverse_desc'].strip()) > 0:
-                series_record["ob"] = prototype['obverse_desc'].strip()
+            if obverse_desc and len(obverse_desc.strip()) > 0:
+                details["ob"] = obverse_desc.strip()
             
-            if prototype['reverse_desc'] and len(prototype['reverse_desc'].strip()) > 0:
-                series_record["rv"] = prototype['reverse_desc'].strip()
+            if reverse_desc and len(reverse_desc.strip()) > 0:
+                details["rv"] = reverse_desc.strip()
             
             # Add distinguishing features from prototype
-            if prototype['features']:
+            if features:
                 try:
-                    features_list = json.loads(prototype['features']) if isinstance(prototype['features'], str) else prototype['features']
+                    features_list = orjson.loads(features) if isinstance(features, (str, bytes)) else features
                     if features_list and len(features_list) > 0:
-                        series_record["df"] = features_list
-                except:
+                        details["df"] = features_list
+                except (ValueError, TypeError):
                     pass
             
             # Add identification keywords from prototype
-            if prototype['keywords']:
+            if keywords:
                 try:
-                    keywords_list = json.loads(prototype['keywords']) if isinstance(prototype['keywords'], str) else prototype['keywords']
+                    keywords_list = orjson.loads(keywords) if isinstance(keywords, (str, bytes)) else keywords
                     if keywords_list and len(keywords_list) > 0:
-                        series_record["kw"] = keywords_list
-                except:
+                        details["kw"] = keywords_list
+                except (ValueError, TypeError):
                     pass
             
             # Add common names from prototype
-            if prototype['names']:
+            if names:
                 try:
-                    names_list = json.loads(prototype['names']) if isinstance(prototype['names'], str) else prototype['names']
+                    names_list = orjson.loads(names) if isinstance(names, (str, bytes)) else names
                     if names_list and len(names_list) > 0:
-                        series_record["cn"] = names_list
-                except:
+                        details["cn"] = names_list
+                except (ValueError, TypeError):
                     pass
             
-            # Collect key dates and varieties from actual coins in database
-            key_dates = []
-            all_varieties = set()
-            
-            for coin in data['coins']:
-                # Collect key dates (non-common rarities)
-                if coin['rarity'] and coin['rarity'] != 'common':
-                    key_dates.append({
-                        'year': coin['year'],
-                        'mint': coin['mint'], 
-                        'rarity': coin['rarity'],
-                        'notes': coin['notes'][:50] + '...' if coin['notes'] and len(coin['notes']) > 50 else coin['notes']
-                    })
-                
-                # Collect varieties
-                if coin['varieties']:
-                    variety_names = self.process_varieties(coin['varieties'])
-                    if variety_names:
-                        all_varieties.update(variety_names)
-            
             # Add key dates if any
             if key_dates:
-                series_record["key_dates"] = key_dates
+                details["key_dates"] = key_dates
             
             # Add varieties if any
             if all_varieties:
-                series_record["v"] = list(all_varieties)
+                details["v"] = list(all_varieties)
+            
+            series_data.append({
+                'head': series_record,
+                'tail': details,
+                'start_year': start_year,
+                'end_year': end_year,
+                'type_code': type_code,
+                'is_xxxx_only': is_xxxx_only
+            })
+        
+        conn.close()
+        return series_data
+
+    def render_series_records(self, series_data):
+        """Render series records with this exporter's coverage field (years or coin_ids)"""
+        series_records = []
+        
+        for series in series_data:
+            # Choose approach based on configuration
+            if series['is_xxxx_only']:
+                # Bullion series with random year - include without year list
+                coverage_field, coverage = "years", "XXXX"
+            elif self.use_year_lists:
+                # APPROACH 1: Comma-delimited year list (more efficient)
+                coverage_field = "years"
+                coverage = self.generate_complete_year_list(series['start_year'], series['end_year'])
+            else:
+                # APPROACH 2: Complete coin ID list (comprehensive but verbose)
+                coverage_field = "coin_ids"  # Complete coin ID coverage
+                coverage = self.generate_complete_coin_ids(
+                    series['head']['series'], series['start_year'], series['end_year'], series['type_code'])
+            
+            if not coverage:
+                continue
             
-            series_records.append(series_record)
-            total_coins_represented += series_record["total_years"]
+            series_records.append({**series['head'], coverage_field: coverage, **series['tail']})
         
-        print(f"📊 Generated {len(series_records)} series covering {total_coins_represented} coin-years")
+        return series_records
+
+    def iter_taxonomy_chunks(self, taxonomy):
+        """Yield compact taxonomy JSON as bytes, one series record at a time.
+
+        The envelope comes first and each series record is serialized on its
+        own, so the whole document never exists as a single string.
+        """
+        envelope = {key: value for key, value in taxonomy.items() if key != "series"}
+        
+        # Compact JSON - no indentation to minimize size
+        yield dumps_ascii(envelope, pretty=False)[:-1]
+        yield b',"series":['
+        for i, record in enumerate(taxonomy["series"]):
+            if i:
+                yield b','
+            yield dumps_ascii(record, pretty=False)
+        yield b']}'
+
+    def write_taxonomy(self, output_file, taxonomy):
+        """Stream taxonomy JSON to output_file (and output_file.gz when enabled).
+
+        The file is opened at the descriptor level and the records are
+        coalesced in a 1 MiB buffer, so current file sizes reach disk in a
+        single write(). The gzip copy is fed from the same chunks, and its
+        header mtime is pinned so identical content compresses identically.
+        """
+        fd = os.open(output_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        with os.fdopen(fd, 'wb', buffering=1 << 20) as f:
+            if not self.write_gzip:
+                for chunk in self.iter_taxonomy_chunks(taxonomy):
+                    f.write(chunk)
+                return
+            
+            gz_file = output_file.with_name(output_file.name + ".gz")
+            with open(gz_file, 'wb') as raw, \
+                    gzip.GzipFile(filename=output_file.name, mode='wb', fileobj=raw,
+                                  compresslevel=6, mtime=0) as gz:
+                for chunk in self.iter_taxonomy_chunks(taxonomy):
+                    f.write(chunk)
+                    gz.write(chunk)
+
+    def write_binary(self, output_file, taxonomy, log=print):
+        """Write a binary copy of the taxonomy next to output_file.
+
+        The binary document carries the same structure as the JSON one,
+        including metadata.field_abbreviations, so it is self-describing.
+        Returns the written path, or None (reported through log) when the
+        codec is not installed.
+        """
+        module_name, suffix = BINARY_FORMATS[self.binary_format]
+        try:
+            codec = importlib.import_module(module_name)
+        except ImportError:
+            log(f"⚠️  {module_name} not installed, skipping {self.binary_format} output...")
+            return None
+        
+        if self.binary_format == "cbor":
+            payload = codec.dumps(taxonomy)
+        else:
+            payload = codec.packb(taxonomy, use_bin_type=True)
+        
+        binary_file = output_file.with_suffix(suffix)
+        binary_file.write_bytes(payload)
+        return binary_file
+
+    def export_ai_taxonomy(self, series_data=None, generated=None, log=print):
+        """Export AI-optimized taxonomy with complete year coverage
+
+        Pass series_data from build_series_data() to reuse a single database
+        pass across several output formats, and a shared generated timestamp
+        to stamp them identically. Progress lines go to log, which prints
+        them by default; pass e.g. a list's append to collect them instead.
+        """
+        log("🤖 Exporting AI-optimized taxonomy with complete year coverage...")
+        
+        if series_data is None:
+            series_data = self.build_series_data()
+        if generated is None:
+            generated = datetime.now(timezone.utc).isoformat()
+        
+        series_records = self.render_series_records(series_data)
+        total_coins_represented = sum(record["total_years"] for record in series_records)
+        
+        log(f"📊 Generated {len(series_records)} series covering {total_coins_represented} coin-years")
         
         # Create AI-optimized taxonomy structure with series-based format
         approach_description = "comma-delimited year lists" if self.use_year_lists else "complete coin ID lists"
@@ -366,7 +485,7 @@ class AITaxonomyExporter:
         taxonomy = {
             "format": format_version,
             "country": "US",
-            "generated": datetime.now(timezone.utc).isoformat(),
+            "generated": generated,
             "approach": approach_description,
             "total_series": len(series_records),
             "total_coin_years": total_coins_represented,
@@ -392,49 +511,74 @@ class AITaxonomyExporter:
         else:
             output_file = self.output_dir / "us_taxonomy.json"  # Keep original name for coin ID approach
             
-        with open(output_file, 'w') as f:
-            # Compact JSON - no indentation to minimize size
-            json.dump(taxonomy, f, separators=(',', ':'))
+        self.write_taxonomy(output_file, taxonomy)
         
         # Calculate size stats  
         file_size = output_file.stat().st_size
-        print(f"✅ AI-optimized taxonomy exported: {output_file}")
-        print(f"📏 File size: {file_size:,} bytes ({file_size/1024:.1f}KB)")
-        print(f"🎯 Total series: {len(series_records)}")
-        print(f"🪙 Total coin-years covered: {total_coins_represented}")
-        print(f"🔧 Approach: {approach_description}")
+        log(f"✅ AI-optimized taxonomy exported: {output_file}")
+        log(f"📏 File size: {file_size:,} bytes ({file_size/1024:.1f}KB)")
+        if self.write_gzip:
+            gz_size = output_file.with_name(output_file.name + ".gz").stat().st_size
+            log(f"🗜️  Gzip size: {gz_size:,} bytes ({gz_size/1024:.1f}KB)")
+        if self.binary_format:
+            binary_file = self.write_binary(output_file, taxonomy, log)
+            if binary_file:
+                binary_size = binary_file.stat().st_size
+                log(f"📦 {self.binary_format.upper()} size: {binary_size:,} bytes ({binary_size/1024:.1f}KB)")
+        log(f"🎯 Total series: {len(series_records)}")
+        log(f"🪙 Total coin-years covered: {total_coins_represented}")
+        log(f"🔧 Approach: {approach_description}")
         
         # Calculate coverage statistics based on approach
         if self.use_year_lists:
             total_years = sum(len(record.get("years", "").split(",")) for record in series_records if record.get("years"))
-            print(f"📅 Total years generated: {total_years:,}")
+            log(f"📅 Total years generated: {total_years:,}")
         else:
             total_coin_ids = sum(len(record.get("coin_ids", "").split(",")) for record in series_records if record.get("coin_ids"))
-            print(f"🏷️  Total coin IDs generated: {total_coin_ids:,}")
+            log(f"🏷️  Total coin IDs generated: {total_coin_ids:,}")
         
         # Compare to complete format if it exists
         complete_file = Path("data/us/us_coins_complete.json")
         if complete_file.exists():
             complete_size = complete_file.stat().st_size
             reduction = ((complete_size - file_size) / complete_size) * 100 if complete_size > 0 else 0
-            print(f"📊 Size vs complete format: {file_size:,} bytes (complete: {complete_size:,} bytes)")
+            log(f"📊 Size vs complete format: {file_size:,} bytes (complete: {complete_size:,} bytes)")
         
-        conn.close()
         return output_file, len(series_records)
 
-def export_both_formats():
+def export_both_formats(binary_format=None, write_gzip=False):
     """Export both year-list and coin-ID formats to preserve existing implementations"""
     print("🚀 Exporting both AI taxonomy formats...")
     
-    # Export year-list version (new, more efficient)
-    print("\n📅 Generating year-list format (efficient)...")
-    year_exporter = AITaxonomyExporter(use_year_lists=True)
-    year_file, year_series = year_exporter.export_ai_taxonomy()
+    # Export year-list version (new, more efficient) and coin-ID version
+    # (original format for compatibility)
+    year_exporter = AITaxonomyExporter(use_year_lists=True, write_gzip=write_gzip,
+                                       binary_format=binary_format)
+    coinid_exporter = AITaxonomyExporter(use_year_lists=False, write_gzip=write_gzip,
+                                         binary_format=binary_format)
     
-    # Export coin-ID version (original format for compatibility)
-    print("\n🏷️  Generating coin-ID format (comprehensive, for existing implementations)...")
-    coinid_exporter = AITaxonomyExporter(use_year_lists=False)
-    coinid_file, coinid_series = coinid_exporter.export_ai_taxonomy()
+    # Read the database once; the formats differ only in their coverage field
+    series_data = year_exporter.build_series_data()
+    generated = datetime.now(timezone.utc).isoformat()
+    
+    # Render and write both files concurrently - the work is mostly file and
+    # gzip I/O, and the shared series data is only read. Each export's
+    # progress lines are collected and printed under its own heading once it
+    # finishes, so the log reads as if they had run one after the other.
+    year_log, coinid_log = [], []
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        year_future = pool.submit(year_exporter.export_ai_taxonomy, series_data, generated,
+                                  year_log.append)
+        coinid_future = pool.submit(coinid_exporter.export_ai_taxonomy, series_data, generated,
+                                    coinid_log.append)
+        
+        year_file, year_series = year_future.result()
+        print("\n📅 Generating year-list format (efficient)...")
+        print("\n".join(year_log))
+        
+        coinid_file, coinid_series = coinid_future.result()
+        print("\n🏷️  Generating coin-ID format (comprehensive, for existing implementations)...")
+        print("\n".join(coinid_log))
     
     print(f"\n✅ Both formats exported successfully:")
     print(f"   📅 Year-list format: {year_file}")
@@ -444,18 +588,27 @@ def export_both_formats():
 
 def main():
     """Main export function"""
+    parser = argparse.ArgumentParser(description="Export the AI-optimized coin taxonomy")
+    parser.add_argument("--binary", choices=sorted(BINARY_FORMATS),
+                        help="Also write a binary copy of each file (needs the binary extra)")
+    parser.add_argument("--gzip", action="store_true",
+                        help="Also write a .json.gz copy of each file")
+    args = parser.parse_args()
+    
     # Configuration: Choose export mode
     EXPORT_BOTH = True  # Set to True to generate both formats, False for single format
+    BINARY_FORMAT = args.binary  # Optional: "cbor" or "msgpack" to also write a binary copy
     
     if EXPORT_BOTH:
-        export_both_formats()
+        export_both_formats(binary_format=BINARY_FORMAT, write_gzip=args.gzip)
     else:
         # Single format export (for development/testing)
         USE_YEAR_LISTS = True  # Default: Use year lists (more efficient)
         
         print(f"🚀 Starting AI taxonomy export with {'YEAR LISTS' if USE_YEAR_LISTS else 'COIN ID LISTS'} approach...")
         
-        exporter = AITaxonomyExporter(use_year_lists=USE_YEAR_LISTS)
+        exporter = AITaxonomyExporter(use_year_lists=USE_YEAR_LISTS, write_gzip=args.gzip,
+                                      binary_format=BINARY_FORMAT)
         exporter.export_ai_taxonomy()
 
 if __name__ == "__main__":
@@ -3,97 +3,142 @@
 Export Canada coins from database to JSON files.
 """
 
-import sqlite3
-import json
 import os
+from concurrent.futures import ThreadPoolExecutor
+from itertools import groupby
+from operator import itemgetter
 from pathlib import Path
 
+import orjson
+
+# Handle imports for both direct execution and module import
+try:
+    from scripts.utils.export_io import dumps_ascii, open_readonly
+except ModuleNotFoundError:
+    from utils.export_io import dumps_ascii, open_readonly
+
+def _write_json(path, obj, copies=()):
+    """Write obj as 2-space indented JSON to path and each of copies.
+
+    obj is serialized once. Files whose content is already identical are left
+    untouched (keeping their mtime); the rest are written to a sibling .tmp
+    file and renamed into place, so an interrupted export never leaves
+    truncated JSON. Returns the (target, changed) pairs.
+    """
+    data = dumps_ascii(obj)
+    results = []
+    for target in (path, *copies):
+        target = Path(target)
+        if target.exists() and target.read_bytes() == data:
+            results.append((target, False))
+            continue
+        tmp_path = target.with_name(target.name + '.tmp')
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, target)
+        results.append((target, True))
+    return results
+
+# Output directory for per-denomination files
+CA_COINS_DIR = Path('data/ca/coins')
+
+# Columns exported per coin, in output key order
+COIN_COLUMNS = (
+    'coin_id', 'series_id', 'denomination', 'series_name', 'year', 'mint',
+    'business_strikes', 'proof_strikes', 'rarity', 'composition',
+    'weight_grams', 'diameter_mm', 'varieties', 'source_citation', 'notes',
+    'obverse_description', 'reverse_description', 'distinguishing_features',
+    'identification_keywords', 'common_names', 'category', 'subcategory'
+)
+
+# Face value in Canadian dollars per denomination
+FACE_VALUES = {
+    'Cents': 0.01,
+    'Five Cents': 0.05,
+    'Ten Cents': 0.10,
+    'Twenty Cents': 0.20,
+    'Twenty-Five Cents': 0.25,
+    'Fifty Cents': 0.50,
+    'Dollars': 1.00,
+    'Two Dollars': 2.00,
+    'Five Dollars': 5.00,
+    'Gold Maple Leaf': 50.00,
+    'Silver Maple Leaf': 5.00,
+    'Platinum Maple Leaf': 50.00,
+    'Palladium Maple Leaf': 50.00,
+    'Sovereign': 1.00
+}
+
+# JSON-encoded columns and the factory for their empty value
+JSON_COLUMNS = {'composition': dict, 'varieties': list}
+
 def export_canada_coins():
     """Export Canada coins to JSON files and universal format."""
     
-    conn = sqlite3.connect('database/coins.db')
+    conn = open_readonly('database/coins.db')
     cursor = conn.cursor()
     
     # Create output directories
-    os.makedirs('data/ca/coins', exist_ok=True)
+    CA_COINS_DIR.mkdir(parents=True, exist_ok=True)
     os.makedirs('data/universal', exist_ok=True)
     os.makedirs('docs/data/universal', exist_ok=True)
     
     print("📊 Exporting Canada coins from database...")
     
     # Get all Canada coins
-    cursor.execute('''
-        SELECT 
-            coin_id, series_id, denomination, series_name, year, mint,
-            business_strikes, proof_strikes, rarity, composition,
-            weight_grams, diameter_mm, varieties, source_citation, notes,
-            obverse_description, reverse_description, distinguishing_features,
-            identification_keywords, common_names, category, subcategory
+    cursor.execute(f'''
+        SELECT {', '.join(COIN_COLUMNS)}
         FROM coins
         WHERE country = 'CA'
         ORDER BY denomination, year, mint
     ''')
     
-    rows = cursor.fetchall()
-    print(f"Found {len(rows)} Canada coins")
-    
-    # Group by denomination
+    # Rows arrive in denomination order, so groupby yields each denomination's
+    # coins as one run. Each coin is projected to the universal issue format
+    # in the same pass, and all_coins matches the denomination files concatenated.
     denominations = {}
-    face_values = {
-        'Cents': 0.01,
-        'Five Cents': 0.05,
-        'Ten Cents': 0.10,
-        'Twenty Cents': 0.20,
-        'Twenty-Five Cents': 0.25,
-        'Fifty Cents': 0.50,
-        'Dollars': 1.00,
-        'Two Dollars': 2.00,
-        'Five Dollars': 5.00,
-        'Gold Maple Leaf': 50.00,
-        'Silver Maple Leaf': 5.00,
-        'Platinum Maple Leaf': 50.00,
-        'Palladium Maple Leaf': 50.00,
-        'Sovereign': 1.00
-    }
-    
-    for row in rows:
-        denom = row[2]  # denomination
-        if denom not in denominations:
-            denominations[denom] = []
-        
-        coin = {
-            'coin_id': row[0],
-            'series_id': row[1],
-            'denomination': row[2],
-            'series_name': row[3],
-            'year': row[4],
-            'mint': row[5],
-            'business_strikes': row[6],
-            'proof_strikes': row[7],
-            'rarity': row[8],
-            'composition': json.loads(row[9]) if row[9] else {},
-            'weight_grams': row[10],
-            'diameter_mm': row[11],
-            'varieties': json.loads(row[12]) if row[12] else [],
-            'source_citation': row[13],
-            'notes': row[14],
-            'obverse_description': row[15],
-            'reverse_description': row[16],
-            'distinguishing_features': row[17],
-            'identification_keywords': row[18],
-            'common_names': row[19],
-            'category': row[20],
-            'subcategory': row[21]
-        }
-        
-        # Remove None values
-        coin = {k: v for k, v in coin.items() if v is not None}
-        denominations[denom].append(coin)
+    all_coins = []
+    issues = []
     
-    # Write denomination files with proper series structure
+    for denom, rows in groupby(cursor, key=itemgetter('denomination')):
+        coins = denominations[denom] = []
+        for row in rows:
+            # Build each coin in one pass, decoding JSON columns and skipping NULLs
+            coin = {}
+            for column, value in zip(COIN_COLUMNS, row):
+                if column in JSON_COLUMNS:
+                    value = orjson.loads(value) if value else JSON_COLUMNS[column]()
+                if value is not None:
+                    coin[column] = value
+            
+            coins.append(coin)
+            all_coins.append(coin)
+            issues.append({
+                'issueId': coin['coin_id'],
+                'country': 'CA',
+                'denomination': coin['denomination'],
+                'year': coin['year'],
+                'mint': coin['mint'],
+                'seriesName': coin['series_name'],
+                'rarity': coin.get('rarity', 'common'),
+                'businessStrikes': coin.get('business_strikes'),
+                'proofStrikes': coin.get('proof_strikes'),
+                'composition': coin.get('composition', {}),
+                'weightGrams': coin.get('weight_grams'),
+                'diameterMm': coin.get('diameter_mm'),
+                'varieties': coin.get('varieties', []),
+                'obverseDescription': coin.get('obverse_description', ''),
+                'reverseDescription': coin.get('reverse_description', ''),
+                'commonNames': coin.get('common_names', '')
+            })
+    
+    print(f"Found {len(all_coins)} Canada coins")
+    
+    # (path, data, copies) for every output file, written together at the end
+    writes = []
+    
+    # Build denomination files with proper series structure
     for denom, coins in denominations.items():
-        filename = f"ca_{denom.lower().replace(' ', '_')}.json"
-        filepath = Path('data/ca/coins') / filename
+        filepath = CA_COINS_DIR / f"ca_{denom.lower().replace(' ', '_')}.json"
         
         # Group coins by series for proper structure
         series_map = {}
@@ -121,19 +166,13 @@ def export_canada_coins():
         data = {
             'country': 'CA',
             'denomination': denom,
-            'face_value': face_values.get(denom, 1.00),
+            'face_value': FACE_VALUES.get(denom, 1.00),
             'series': list(series_map.values())
         }
         
-        with open(filepath, 'w') as f:
-            json.dump(data, f, indent=2)
-        print(f"✅ Written {filepath}")
+        writes.append((filepath, data, ()))
     
     # Create complete file
-    all_coins = []
-    for coins in denominations.values():
-        all_coins.extend(coins)
-    
     complete_data = {
         'country': 'CA',
         'total_coins': len(all_coins),
@@ -141,34 +180,9 @@ def export_canada_coins():
         'coins': all_coins
     }
     
-    with open('data/ca/ca_coins_complete.json', 'w') as f:
-        json.dump(complete_data, f, indent=2)
-    print("✅ Written data/ca/ca_coins_complete.json")
-    
-    # Create universal format for frontend
-    issues = []
-    for coin in all_coins:
-        issue = {
-            'issueId': coin['coin_id'],
-            'country': 'CA',
-            'denomination': coin['denomination'],
-            'year': coin['year'],
-            'mint': coin['mint'],
-            'seriesName': coin['series_name'],
-            'rarity': coin.get('rarity', 'common'),
-            'businessStrikes': coin.get('business_strikes'),
-            'proofStrikes': coin.get('proof_strikes'),
-            'composition': coin.get('composition', {}),
-            'weightGrams': coin.get('weight_grams'),
-            'diameterMm': coin.get('diameter_mm'),
-            'varieties': coin.get('varieties', []),
-            'obverseDescription': coin.get('obverse_description', ''),
-            'reverseDescription': coin.get('reverse_description', ''),
-            'commonNames': coin.get('common_names', '')
-        }
-        issues.append(issue)
+    writes.append(('data/ca/ca_coins_complete.json', complete_data, ()))
     
-    # Write universal format
+    # Create universal format
     universal_data = {
         'country': 'CA',
         'countryName': 'Canada',
@@ -176,17 +190,15 @@ def export_canada_coins():
         'issues': issues
     }
     
-    # Write to both locations for frontend access
-    for path in ['data/universal/ca_issues.json', 'docs/data/universal/ca_issues.json']:
-        with open(path, 'w') as f:
-            json.dump(universal_data, f, indent=2)
-        print(f"✅ Written {path}")
+    # Written to both locations for frontend access
+    writes.append(('data/universal/ca_issues.json', universal_data,
+                   ('docs/data/universal/ca_issues.json',)))
     
     # Update taxonomy summary to include Canada
     summary_path = 'data/universal/taxonomy_summary.json'
     if os.path.exists(summary_path):
-        with open(summary_path, 'r') as f:
-            summary = json.load(f)
+        with open(summary_path, 'rb') as f:
+            summary = orjson.loads(f.read())
     else:
         summary = {}
     
@@ -200,17 +212,17 @@ def export_canada_coins():
     # Update country count
     summary['countries'] = len(summary.get('issue_files', []))
     
-    # Write updated summary
-    with open(summary_path, 'w') as f:
-        json.dump(summary, f, indent=2)
-    print(f"✅ Updated {summary_path}")
-    
-    # Copy to docs
+    # Write updated summary, with a copy in docs
     docs_summary = 'docs/data/universal/taxonomy_summary.json'
-    if os.path.exists('docs/data/universal'):
-        with open(docs_summary, 'w') as f:
-            json.dump(summary, f, indent=2)
-        print(f"✅ Updated {docs_summary}")
+    summary_copies = (docs_summary,) if os.path.exists('docs/data/universal') else ()
+    writes.append((summary_path, summary, summary_copies))
+    
+    # The files are independent, so serialize and write them concurrently
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        futures = [pool.submit(_write_json, path, data, copies) for path, data, copies in writes]
+        for future in futures:
+            for target, changed in future.result():
+                print(f"✅ Written {target}" if changed else f"⏭️  Unchanged {target}")
     
     conn.close()
     print(f"\n✅ Export complete: {len(all_coins)} Canada coins exported")
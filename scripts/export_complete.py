@@ -2,29 +2,28 @@
 """
 DEPRECATED: Use export_us_complete.py instead.
 
-This script is kept for compatibility but redirects to the new script.
+This script is kept for compatibility but delegates to the new script.
 """
 
-import subprocess
 import sys
-import os
+
+from export_us_complete import main as export_us_complete_main
 
 def main():
-    """Redirect to the new export script"""
-    print("⚠️  This script is deprecated. Redirecting to export_us_complete.py...")
-    print("🔄 Running: python scripts/export_us_complete.py")
+    """Delegate to the new export script"""
+    print("⚠️  This script is deprecated. Delegating to export_us_complete.py...")
     print()
-    
-    # Run the new script
-    result = subprocess.run([sys.executable, 'scripts/export_us_complete.py'])
-    
-    if result.returncode == 0:
-        print()
-        print("✅ Complete! For future use, run:")
-        print("   uv run python scripts/export_us_complete.py")
-    else:
-        print("❌ Export failed. Please run export_us_complete.py directly.")
+
+    # Run the new script in-process
+    try:
+        export_us_complete_main()
+    except Exception as e:
+        print(f"❌ Export failed: {e}. Please run export_us_complete.py directly.")
         sys.exit(1)
 
+    print()
+    print("✅ Complete! For future use, run:")
+    print("   uv run python scripts/export_us_complete.py")
+
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -4,57 +4,130 @@ Export database with series_metadata and composition_periods tables to JSON file
 This maintains the database as the source of truth while keeping JSON files for version control.
 """
 
-import json
 import sqlite3
 import os
 from collections import defaultdict
+from itertools import groupby
+from operator import itemgetter
+
+import orjson
+
+# Handle imports for both direct execution and module import
+try:
+    from scripts.utils.export_io import dumps_ascii, open_readonly
+except ModuleNotFoundError:
+    from utils.export_io import dumps_ascii, open_readonly
+
+# Face value in dollars per denomination
+FACE_VALUES = {
+    'Cents': 0.01,
+    'Nickels': 0.05,
+    'Dimes': 0.10,
+    'Quarters': 0.25,
+    'Half Dollars': 0.50,
+    'Dollars': 1.00
+}
+
+def _write_json(path, obj):
+    """Write obj to path as 2-space indented, \\u-escaped JSON in a single write"""
+    data = dumps_ascii(obj)
+    with open(path, 'wb') as f:
+        f.write(data)
 
 def export_to_json(db_path='database/coins.db', output_dir='data'):
     """Export database contents to JSON files"""
     
-    conn = sqlite3.connect(db_path)
-    cursor = conn.cursor()
-    cursor.execute('PRAGMA foreign_keys = ON;')  # Enable foreign key enforcement
-    conn.row_factory = sqlite3.Row
+    conn = open_readonly(db_path)
+    conn.execute('PRAGMA foreign_keys = ON;')  # Enable foreign key enforcement
+    
+    # Composition periods for every series, in start_year order
+    periods_by_series = defaultdict(list)
+    for period in conn.execute('''
+        SELECT series_id, start_year, end_year, alloy_name, alloy_composition, weight_grams
+        FROM composition_periods
+        ORDER BY series_id, start_year
+    '''):
+        periods_by_series[period['series_id']].append({
+            "date_range": {
+                "start": period['start_year'],
+                "end": period['end_year']
+            },
+            "alloy_name": period['alloy_name'],
+            "alloy": orjson.loads(period['alloy_composition']),
+            "weight": {
+                "grams": period['weight_grams']
+            }
+        })
+    
+    # Coins grouped by (country, denomination, series_id), in year/mint order
+    coins_by_series = defaultdict(list)
+    for coin in conn.execute('''
+        SELECT country, denomination, series_id, coin_id, year, mint,
+               business_strikes, proof_strikes, rarity, source_citation, notes,
+               CASE WHEN json_valid(varieties) THEN varieties END AS varieties
+        FROM coins
+        ORDER BY country, denomination, series_id, year, mint
+    '''):
+        coin_data_item = {
+            "coin_id": coin['coin_id'],
+            "year": coin['year'],
+            "mint": coin['mint'],
+            "business_strikes": coin['business_strikes'],
+            "proof_strikes": coin['proof_strikes']
+        }
+        
+        # Add optional fields
+        if coin['rarity']:
+            coin_data_item['rarity'] = coin['rarity']
+        if coin['source_citation']:
+            coin_data_item['source_citation'] = coin['source_citation']
+        if coin['notes']:
+            coin_data_item['notes'] = coin['notes']
+        if coin['varieties']:
+            # json_valid() in the query drops most malformed JSON up front, but
+            # SQLite 3.42-3.44 also accepts JSON5 there, which json cannot parse
+            try:
+                coin_data_item['varieties'] = orjson.loads(coin['varieties'])
+            except (ValueError, TypeError):
+                pass
+        
+        coins_by_series[(coin['country'], coin['denomination'], coin['series_id'])].append(coin_data_item)
+    
+    # Series metadata for every (country, denomination), in start_year order
+    series_by_denomination = defaultdict(list)
+    for series_row in conn.execute('''
+        SELECT DISTINCT c.country, c.denomination, sm.series_id, sm.series_name, sm.official_name,
+               sm.start_year, sm.end_year, sm.obverse_designer, sm.reverse_designer,
+               sm.diameter_mm, sm.thickness_mm, sm.edge_type
+        FROM series_metadata sm
+        JOIN coins c ON sm.series_id = c.series_id
+        ORDER BY c.country, c.denomination, sm.start_year
+    '''):
+        series_by_denomination[(series_row['country'], series_row['denomination'])].append(series_row)
     
-    # Get all countries
-    countries = conn.execute('SELECT DISTINCT country FROM coins ORDER BY country').fetchall()
+    # Walk every (country, denomination) pair and assemble its file
+    denominations = conn.execute('''
+        SELECT DISTINCT country, denomination FROM coins
+        ORDER BY country, denomination
+    ''').fetchall()
     
-    for country_row in countries:
-        country = country_row['country'].lower()
+    for country_code, denom_rows in groupby(denominations, key=itemgetter('country')):
+        country = country_code.lower()
         country_dir = f"{output_dir}/{country}/coins"
         os.makedirs(country_dir, exist_ok=True)
         
-        # Get denominations for this country
-        denominations = conn.execute('''
-            SELECT DISTINCT denomination FROM coins 
-            WHERE country = ? 
-            ORDER BY denomination
-        ''', (country_row['country'],)).fetchall()
-        
-        for denom_row in denominations:
+        for denom_row in denom_rows:
             denomination = denom_row['denomination']
             
             # Build the JSON structure
             coin_data = {
-                "country": country_row['country'],
+                "country": country_code,
                 "denomination": denomination,
                 "face_value": get_face_value(denomination),
                 "series": []
             }
             
-            # Get series for this denomination using the series_metadata table
-            series_list = conn.execute('''
-                SELECT DISTINCT sm.series_id, sm.series_name, sm.official_name,
-                       sm.start_year, sm.end_year, sm.obverse_designer, sm.reverse_designer,
-                       sm.diameter_mm, sm.thickness_mm, sm.edge_type
-                FROM series_metadata sm
-                JOIN coins c ON sm.series_id = c.series_id
-                WHERE c.country = ? AND c.denomination = ?
-                ORDER BY sm.start_year
-            ''', (country_row['country'], denomination)).fetchall()
-            
-            for series_row in series_list:
+            for series_row in series_by_denomination[(country_code, denomination)]:
                 series_id = series_row['series_id']
                 
                 # Build series structure with metadata
@@ -71,77 +144,21 @@ def export_to_json(db_path='database/coins.db', output_dir='data'):
                         "thickness_mm": series_row['thickness_mm'],
                         "edge": series_row['edge_type']
                     },
-                    "composition_periods": [],
-                    "coins": [],
+                    "composition_periods": periods_by_series[series_id],
+                    "coins": coins_by_series[(country_code, denomination, series_id)],
                     "designers": {
                         "obverse": series_row['obverse_designer'],
                         "reverse": series_row['reverse_designer']
                     }
                 }
                 
-                # Get composition periods for this series
-                comp_periods = conn.execute('''
-                    SELECT start_year, end_year, alloy_name, alloy_composition, weight_grams
-                    FROM composition_periods
-                    WHERE series_id = ?
-                    ORDER BY start_year
-                ''', (series_id,)).fetchall()
-                
-                for period in comp_periods:
-                    period_data = {
-                        "date_range": {
-                            "start": period['start_year'],
-                            "end": period['end_year']
-                        },
-                        "alloy_name": period['alloy_name'],
-                        "alloy": json.loads(period['alloy_composition']),
-                        "weight": {
-                            "grams": period['weight_grams']
-                        }
-                    }
-                    series_data['composition_periods'].append(period_data)
-                
-                # Get coins for this series
-                coins = conn.execute('''
-                    SELECT coin_id, year, mint, business_strikes, proof_strikes, 
-                           rarity, varieties, source_citation, notes
-                    FROM coins 
-                    WHERE country = ? AND denomination = ? AND series_id = ?
-                    ORDER BY year, mint
-                ''', (country_row['country'], denomination, series_id)).fetchall()
-                
-                for coin in coins:
-                    coin_data_item = {
-                        "coin_id": coin['coin_id'],
-                        "year": coin['year'],
-                        "mint": coin['mint'],
-                        "business_strikes": coin['business_strikes'],
-                        "proof_strikes": coin['proof_strikes']
-                    }
-                    
-                    # Add optional fields
-                    if coin['rarity']:
-                        coin_data_item['rarity'] = coin['rarity']
-                    if coin['source_citation']:
-                        coin_data_item['source_citation'] = coin['source_citation']
-                    if coin['notes']:
-                        coin_data_item['notes'] = coin['notes']
-                    if coin['varieties']:
-                        try:
-                            coin_data_item['varieties'] = json.loads(coin['varieties'])
-                        except (json.JSONDecodeError, TypeError):
-                            pass
-                    
-                    series_data['coins'].append(coin_data_item)
-                
                 coin_data['series'].append(series_data)
             
             # Write to file
             filename = denomination.lower().replace(' ', '_') + '.json'
             output_path = os.path.join(country_dir, filename)
             
-            with open(output_path, 'w') as f:
-                json.dump(coin_data, f, indent=2)
+            _write_json(output_path, coin_data)
             
             print(f"Exported {denomination} to {output_path}")
     
@@ -149,15 +166,7 @@ def export_to_json(db_path='database/coins.db', output_dir='data'):
 
 def get_face_value(denomination):
     """Get face value for denomination"""
-    values = {
-        'Cents': 0.01,
-        'Nickels': 0.05,
-        'Dimes': 0.10,
-        'Quarters': 0.25,
-        'Half Dollars': 0.50,
-        'Dollars': 1.00
-    }
-    return values.get(denomination, 0.0)
+    return FACE_VALUES.get(denomination, 0.0)
 
 def main():
     """Main export function"""
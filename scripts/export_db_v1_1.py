@@ -9,21 +9,96 @@ This script supports:
 3. Banknote support (when available)
 """
 
-import json
-import sqlite3
+import argparse
+import io
 import os
+import tarfile
 from datetime import datetime, timezone
+from functools import lru_cache
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from itertools import groupby
+from operator import itemgetter
 from pathlib import Path
 
+import orjson
+
+# Handle imports for both direct execution and module import
+try:
+    from scripts.utils.export_io import dumps_ascii, open_readonly
+except ModuleNotFoundError:
+    from utils.export_io import dumps_ascii, open_readonly
+
+try:
+    import zstandard  # Optional: legacy .tar.zst bundle (uv sync --extra bundle)
+except ImportError:
+    zstandard = None
+
+
+# Indent exported files for human review; main() clears this for --compact
+_PRETTY = True
+
+def _json_bytes(obj):
+    """Serialize obj to 2-space indented (or, with --compact, minified) JSON bytes.
+
+    Output is ASCII with \\u escapes, byte-for-byte what json.dumps writes
+    by default, so regenerated files match the checked-in ones.
+    """
+    return dumps_ascii(obj, pretty=_PRETTY)
+
+
+def _json_item(obj):
+    """Serialize obj as an item of a top-level object's array field."""
+    if not _PRETTY:
+        return _json_bytes(obj)
+    # JSON strings never contain raw newlines, so re-indenting line starts is safe
+    return b'    ' + _json_bytes(obj).replace(b'\n', b'\n    ')
+
+
+def _json_line(obj):
+    """Serialize obj as one compact NDJSON line."""
+    return orjson.dumps(obj, option=orjson.OPT_APPEND_NEWLINE)
+
+
+def _write_json(path, obj):
+    """Write obj to path as JSON in a single write."""
+    with open(path, 'wb') as f:
+        f.write(_json_bytes(obj))
+
+
+# Face value in dollars per denomination
+FACE_VALUES = {
+    'Cents': 0.01,
+    'Nickels': 0.05,
+    'Dimes': 0.10,
+    'Quarters': 0.25,
+    'Half Dollars': 0.50,
+    'Dollars': 1.00
+}
+
+
+@lru_cache(maxsize=8192)
+def _cached_json_loads(data):
+    """Parse a JSON column value once per distinct string.
+
+    Many rows share identical blobs (e.g. specifications), so every row with
+    the same text gets the same parsed object. Callers must treat it as
+    read-only: the exports only serialize it, and anything that needs to
+    modify it must copy it first.
+    """
+    return orjson.loads(data)
+
 
 def safe_json_loads(data, default=None):
-    """Safely parse JSON data, returning default on error."""
+    """Safely parse JSON data, returning default on error.
+
+    The result may be shared with other rows; see _cached_json_loads.
+    """
     if not data:
         return default
     try:
-        return json.loads(data)
-    except (json.JSONDecodeError, TypeError):
+        return _cached_json_loads(data)
+    except (orjson.JSONDecodeError, TypeError):
         return default
 
 
@@ -39,48 +114,116 @@ def check_universal_tables(conn):
     return universal_tables.issubset(tables)
 
 
-def export_legacy_format(conn, output_dir='data'):
-    """Export in legacy nested format for backward compatibility."""
+def export_legacy_format(conn, output_dir='data', bundle=False):
+    """Export in legacy nested format for backward compatibility.
+
+    With bundle=True the per-denomination files are streamed into a single
+    <output_dir>/legacy.tar.zst instead of the <country>/coins/ tree; without
+    zstandard installed the tree is written as usual.
+    """
     print("Exporting legacy format...")
     
-    # Get all countries from coin_id prefix
-    countries = conn.execute('SELECT DISTINCT substr(coin_id, 1, 2) as country FROM coins ORDER BY country').fetchall()
+    if bundle and zstandard is None:
+        print("⚠️  zstandard not installed, writing the directory tree instead...")
+        bundle = False
     
-    for country_row in countries:
-        country = country_row['country'].lower()
-        country_dir = f"{output_dir}/{country}/coins"
-        os.makedirs(country_dir, exist_ok=True)
+    cursor = conn.cursor()
+    
+    # Composition periods for every series, in start_year order
+    periods_by_series = defaultdict(list)
+    for period in cursor.execute('''
+        SELECT series_id, start_year, end_year, alloy_name, alloy_composition, weight_grams
+        FROM composition_periods
+        ORDER BY series_id, start_year
+    '''):
+        periods_by_series[period['series_id']].append({
+            "date_range": {
+                "start": period['start_year'],
+                "end": period['end_year']
+            },
+            "alloy_name": period['alloy_name'],
+            "alloy": orjson.loads(period['alloy_composition']),
+            "weight": {
+                "grams": period['weight_grams']
+            }
+        })
+    
+    # Coins grouped by (country, denomination, series_id), in year/mint order.
+    # This is the largest scan, so rows come back as plain tuples and are
+    # unpacked positionally instead of looked up by name.
+    coins_by_series = defaultdict(list)
+    coin_cursor = conn.cursor()
+    coin_cursor.row_factory = None
+    coin_cursor.execute('''
+        SELECT country, denomination, series_id, coin_id, year, mint,
+               business_strikes, proof_strikes, rarity, varieties, source_citation, notes
+        FROM coins
+        ORDER BY country, denomination, series_id, year, mint
+    ''')
+    for (country_code, denomination, series_id, coin_id, year, mint,
+         business_strikes, proof_strikes, rarity, varieties, source_citation, notes) in coin_cursor:
+        coin_data_item = {
+            "coin_id": coin_id,
+            "year": year,
+            "mint": mint,
+            "business_strikes": business_strikes,
+            "proof_strikes": proof_strikes
+        }
         
-        # Get denominations for this country
-        denominations = conn.execute('''
-            SELECT DISTINCT denomination FROM coins 
-            WHERE substr(coin_id, 1, 2) = ? 
-            ORDER BY denomination
-        ''', (country_row['country'],)).fetchall()
+        # Add optional fields
+        if rarity:
+            coin_data_item['rarity'] = rarity
+        if source_citation:
+            coin_data_item['source_citation'] = source_citation
+        if notes:
+            coin_data_item['notes'] = notes
+        if varieties:
+            # A stored JSON null is kept as "varieties": null; only
+            # malformed JSON is dropped
+            try:
+                coin_data_item['varieties'] = _cached_json_loads(varieties)
+            except (orjson.JSONDecodeError, TypeError):
+                pass
         
-        for denom_row in denominations:
+        coins_by_series[(country_code, denomination, series_id)].append(coin_data_item)
+    
+    # Series metadata for every (country, denomination), in start_year order
+    series_by_denomination = defaultdict(list)
+    for series_row in cursor.execute('''
+        SELECT DISTINCT c.country, c.denomination, sm.series_id, sm.series_name, sm.official_name,
+               sm.start_year, sm.end_year, sm.obverse_designer, sm.reverse_designer,
+               sm.diameter_mm, sm.edge_type
+        FROM series_metadata sm
+        JOIN coins c ON sm.series_id = c.series_id
+        ORDER BY c.country, c.denomination, sm.start_year
+    '''):
+        series_by_denomination[(series_row['country'], series_row['denomination'])].append(series_row)
+    
+    # Every (country, denomination) pair, with the country from the coin_id prefix
+    denominations = cursor.execute('''
+        SELECT DISTINCT substr(coin_id, 1, 2) as country, denomination FROM coins
+        ORDER BY country, denomination
+    ''').fetchall()
+    
+    # (denomination, path relative to output_dir, document) per output file
+    writes = []
+    for country_code, denom_rows in groupby(denominations, key=itemgetter('country')):
+        country = country_code.lower()
+        if not bundle:
+            os.makedirs(f"{output_dir}/{country}/coins", exist_ok=True)
+        
+        for denom_row in denom_rows:
             denomination = denom_row['denomination']
             
             # Build the JSON structure
             coin_data = {
-                "country": country_row['country'],
+                "country": country_code,
                 "denomination": denomination,
                 "face_value": get_face_value(denomination),
                 "series": []
             }
             
-            # Get series for this denomination
-            series_list = conn.execute('''
-                SELECT DISTINCT sm.series_id, sm.series_name, sm.official_name,
-                       sm.start_year, sm.end_year, sm.obverse_designer, sm.reverse_designer,
-                       sm.diameter_mm, sm.edge_type
-                FROM series_metadata sm
-                JOIN coins c ON sm.series_id = c.series_id
-                WHERE c.country = ? AND c.denomination = ?
-                ORDER BY sm.start_year
-            ''', (country_row['country'], denomination)).fetchall()
-            
-            for series_row in series_list:
+            for series_row in series_by_denomination[(country_code, denomination)]:
                 series_id = series_row['series_id']
                 
                 # Build series structure with metadata
@@ -96,83 +239,61 @@ def export_legacy_format(conn, output_dir='data'):
                         "diameter_mm": series_row['diameter_mm'],
                         "edge": series_row['edge_type']
                     },
-                    "composition_periods": [],
-                    "coins": [],
+                    "composition_periods": periods_by_series[series_id],
+                    "coins": coins_by_series[(country_code, denomination, series_id)],
                     "designers": {
                         "obverse": series_row['obverse_designer'],
                         "reverse": series_row['reverse_designer']
                     }
                 }
                 
-                # Get composition periods for this series
-                comp_periods = conn.execute('''
-                    SELECT start_year, end_year, alloy_name, alloy_composition, weight_grams
-                    FROM composition_periods
-                    WHERE series_id = ?
-                    ORDER BY start_year
-                ''', (series_id,)).fetchall()
-                
-                for period in comp_periods:
-                    period_data = {
-                        "date_range": {
-                            "start": period['start_year'],
-                            "end": period['end_year']
-                        },
-                        "alloy_name": period['alloy_name'],
-                        "alloy": json.loads(period['alloy_composition']),
-                        "weight": {
-                            "grams": period['weight_grams']
-                        }
-                    }
-                    series_data['composition_periods'].append(period_data)
-                
-                # Get coins for this series
-                coins = conn.execute('''
-                    SELECT coin_id, year, mint, business_strikes, proof_strikes, 
-                           rarity, varieties, source_citation, notes
-                    FROM coins 
-                    WHERE country = ? AND denomination = ? AND series_id = ?
-                    ORDER BY year, mint
-                ''', (country_row['country'], denomination, series_id)).fetchall()
-                
-                for coin in coins:
-                    coin_data_item = {
-                        "coin_id": coin['coin_id'],
-                        "year": coin['year'],
-                        "mint": coin['mint'],
-                        "business_strikes": coin['business_strikes'],
-                        "proof_strikes": coin['proof_strikes']
-                    }
-                    
-                    # Add optional fields
-                    if coin['rarity']:
-                        coin_data_item['rarity'] = coin['rarity']
-                    if coin['source_citation']:
-                        coin_data_item['source_citation'] = coin['source_citation']
-                    if coin['notes']:
-                        coin_data_item['notes'] = coin['notes']
-                    if coin['varieties']:
-                        try:
-                            coin_data_item['varieties'] = json.loads(coin['varieties'])
-                        except (json.JSONDecodeError, TypeError):
-                            pass
-                    
-                    series_data['coins'].append(coin_data_item)
-                
                 coin_data['series'].append(series_data)
             
-            # Write to file
             filename = denomination.lower().replace(' ', '_') + '.json'
-            output_path = os.path.join(country_dir, filename)
-            
-            with open(output_path, 'w') as f:
-                json.dump(coin_data, f, indent=2)
-            
-            print(f"✓ Exported {denomination} to {output_path}")
-
-
-def export_universal_format(conn, output_dir='data'):
-    """Export new universal flat format."""
+            writes.append((denomination, f"{country}/coins/{filename}", coin_data))
+    
+    if bundle:
+        _write_legacy_bundle(f"{output_dir}/legacy.tar.zst", writes)
+        return
+    
+    # Every document is built and the database is no longer touched, so the
+    # independent files are encoded and written in parallel: one worker per
+    # file, capped at the CPU count
+    if writes:
+        max_workers = max(1, min(os.cpu_count() or 1, len(writes)))
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            futures = [pool.submit(_write_json, os.path.join(output_dir, name), coin_data)
+                       for _, name, coin_data in writes]
+            for (denomination, name, _), future in zip(writes, futures):
+                future.result()
+                print(f"✓ Exported {denomination} to {os.path.join(output_dir, name)}")
+
+
+def _write_legacy_bundle(bundle_path, writes):
+    """Stream the legacy documents into a zstd-compressed tar at bundle_path.
+
+    writes are (denomination, member name, document) tuples, added in order.
+    A partially written bundle is removed if anything fails.
+    """
+    try:
+        with open(bundle_path, 'wb') as raw, \
+                zstandard.ZstdCompressor(level=10).stream_writer(raw) as bundle_stream, \
+                tarfile.open(fileobj=bundle_stream, mode='w|') as tar:
+            for denomination, name, coin_data in writes:
+                data = _json_bytes(coin_data)
+                info = tarfile.TarInfo(name)
+                info.size = len(data)
+                info.mode = 0o644
+                tar.addfile(info, io.BytesIO(data))
+                print(f"✓ Bundled {denomination} as {info.name}")
+    except BaseException:
+        Path(bundle_path).unlink(missing_ok=True)
+        raise
+    print(f"✓ Wrote legacy bundle {bundle_path}")
+
+
+def export_universal_format(conn, output_dir='data', ndjson=False):
+    """Export new universal flat format (plus per-country NDJSON when ndjson is set)."""
     print("Exporting universal format...")
     
     # Create universal output directory
@@ -183,10 +304,30 @@ def export_universal_format(conn, output_dir='data'):
     export_registries(conn, universal_dir)
     
     # Export issues by country
-    export_issues_by_country(conn, universal_dir)
+    country_counts = export_issues_by_country(conn, universal_dir, ndjson)
     
     # Export complete dataset
-    export_complete_universal_dataset(conn, universal_dir)
+    export_complete_universal_dataset(conn, universal_dir, country_counts)
+
+
+def _registry_records(cursor, json_columns):
+    """Build one dict per row of cursor, keyed by column name.
+
+    json_columns maps JSON-encoded columns to a factory for their empty
+    value (None to drop them when empty). NULL values are never inserted.
+    """
+    columns = [description[0] for description in cursor.description]
+    records = []
+    for row in cursor:
+        record = {}
+        for column, value in zip(columns, row):
+            if column in json_columns:
+                empty = json_columns[column]
+                value = safe_json_loads(value, empty() if empty else None)
+            if value is not None:
+                record[column] = value
+        records.append(record)
+    return records
 
 
 def export_registries(conn, output_dir):
@@ -194,200 +335,200 @@ def export_registries(conn, output_dir):
     cursor = conn.cursor()
     
     # Subject Registry
-    cursor.execute('SELECT * FROM subject_registry ORDER BY subject_id')
-    subjects = []
-    for row in cursor.fetchall():
-        subject = {
-            'subject_id': row[0],
-            'type': row[1],
-            'name': row[2],
-            'nationality': row[3],
-            'roles': safe_json_loads(row[4], []),
-            'life_dates': safe_json_loads(row[5], {}),
-            'reign_dates': safe_json_loads(row[6], {}),
-            'significance': row[7],
-            'symbolism': safe_json_loads(row[8], []),
-            'scientific_name': row[9],
-            'first_coin_appearance': row[10],
-            'metadata': safe_json_loads(row[11], {})
-        }
-        # Remove null values
-        subjects.append({k: v for k, v in subject.items() if v is not None})
+    cursor.execute('''
+        SELECT subject_id, type, name, nationality, roles, life_dates, reign_dates,
+               significance, symbolism, scientific_name, first_coin_appearance, metadata
+        FROM subject_registry
+        ORDER BY subject_id
+    ''')
+    subjects = _registry_records(cursor, {
+        'roles': list, 'life_dates': dict, 'reign_dates': dict, 'symbolism': list, 'metadata': dict
+    })
     
-    with open(f"{output_dir}/subject_registry.json", 'w') as f:
-        json.dump({"subjects": subjects}, f, indent=2)
+    _write_json(f"{output_dir}/subject_registry.json", {"subjects": subjects})
     print(f"✓ Exported {len(subjects)} subjects")
     
     # Composition Registry
-    cursor.execute('SELECT * FROM composition_registry ORDER BY composition_key')
-    compositions = []
-    for row in cursor.fetchall():
-        comp = {
-            'composition_key': row[0],
-            'name': row[1],
-            'alloy_composition': safe_json_loads(row[2], {}),
-            'period_description': row[3],
-            'density_g_cm3': row[4],
-            'magnetic_properties': row[5],
-            'color_description': row[6]
-        }
-        # Remove null values
-        compositions.append({k: v for k, v in comp.items() if v is not None})
+    cursor.execute('''
+        SELECT composition_key, name, alloy_composition, period_description,
+               density_g_cm3, magnetic_properties, color_description
+        FROM composition_registry
+        ORDER BY composition_key
+    ''')
+    compositions = _registry_records(cursor, {'alloy_composition': dict})
     
-    with open(f"{output_dir}/composition_registry.json", 'w') as f:
-        json.dump({"compositions": compositions}, f, indent=2)
+    _write_json(f"{output_dir}/composition_registry.json", {"compositions": compositions})
     print(f"✓ Exported {len(compositions)} compositions")
     
     # Series Registry
-    cursor.execute('SELECT * FROM series_registry ORDER BY series_id')
-    series_list = []
-    for row in cursor.fetchall():
-        row_dict = dict(row)
-        series = {
-            'series_id': row_dict.get('series_id'),
-            'series_name': row_dict.get('series_name'),
-            'country_code': row_dict.get('country_code'),
-            'denomination': row_dict.get('denomination'),
-            'start_year': row_dict.get('start_year'),
-            'end_year': row_dict.get('end_year'),
-            'defining_characteristics': row_dict.get('defining_characteristics'),
-            'official_name': row_dict.get('official_name'),
-            'type': row_dict.get('type'),
-            'series_group': row_dict.get('series_group')
-        }
-        # Parse aliases JSON if present
-        if row_dict.get('aliases'):
-            try:
-                series['aliases'] = json.loads(row_dict['aliases'])
-            except (json.JSONDecodeError, TypeError):
-                pass
-        # Parse variety_suffixes JSON if present
-        if row_dict.get('variety_suffixes'):
-            try:
-                series['variety_suffixes'] = json.loads(row_dict['variety_suffixes'])
-            except (json.JSONDecodeError, TypeError):
-                pass
-        # Remove null values
-        series_list.append({k: v for k, v in series.items() if v is not None})
+    cursor.execute('''
+        SELECT series_id, series_name, country_code, denomination, start_year, end_year,
+               defining_characteristics, official_name, type, series_group,
+               aliases, variety_suffixes
+        FROM series_registry
+        ORDER BY series_id
+    ''')
+    series_list = _registry_records(cursor, {'aliases': None, 'variety_suffixes': None})
     
-    with open(f"{output_dir}/series_registry.json", 'w') as f:
-        json.dump({"series": series_list}, f, indent=2)
+    _write_json(f"{output_dir}/series_registry.json", {"series": series_list})
     print(f"✓ Exported {len(series_list)} series")
 
 
-def export_issues_by_country(conn, output_dir):
-    """Export issues grouped by country."""
-    cursor = conn.cursor()
-    
-    # Get countries
-    cursor.execute('SELECT DISTINCT country_code FROM issues ORDER BY country_code')
-    countries = [row[0] for row in cursor.fetchall()]
-    
-    for country in countries:
-        cursor.execute('''
-            SELECT * FROM issues
-            WHERE country_code = ?
-            ORDER BY issue_year, face_value
-        ''', (country,))
-        
-        issues = []
-        for row in cursor.fetchall():
-            # Convert row to dict for easier column access
-            row_dict = dict(row)
-
-            # Parse JSON fields
-            try:
-                specifications = json.loads(row_dict.get('specifications', '{}')) if row_dict.get('specifications') else {}
-            except (json.JSONDecodeError, TypeError):
-                specifications = {}
+@lru_cache(maxsize=None)
+def _issuing_entity(country_code, authority_name, monetary_system, currency_unit):
+    """Return the shared issuing_entity dict for one issuing authority."""
+    # A country only has a handful of authorities, so issues share these dicts
+    return {
+        'country_code': country_code,
+        'authority_name': authority_name,
+        'monetary_system': monetary_system,
+        'currency_unit': currency_unit
+    }
 
-            try:
-                sides = json.loads(row_dict.get('sides', '{}')) if row_dict.get('sides') else {}
-            except (json.JSONDecodeError, TypeError):
-                sides = {}
 
-            try:
-                mintage = json.loads(row_dict.get('mintage', '{}')) if row_dict.get('mintage') else {}
-            except (json.JSONDecodeError, TypeError):
-                mintage = {}
-
-            try:
-                varieties = json.loads(row_dict.get('varieties', '[]')) if row_dict.get('varieties') else []
-            except (json.JSONDecodeError, TypeError):
-                varieties = []
+def _build_issue(row):
+    """Build the universal issue dict for an issues table row."""
+    # Parse JSON fields
+    specifications = safe_json_loads(row['specifications'], {})
+    sides = safe_json_loads(row['sides'], {})
+    mintage = safe_json_loads(row['mintage'], {})
+    varieties = safe_json_loads(row['varieties'], [])
+    common_names = safe_json_loads(row['common_names'], [])
+
+    issue = {
+        'issue_id': row['issue_id'],
+        'object_type': row['object_type'],
+        'series_id': row['series_id'],
+        'series_name': row['series_id'],  # For display
+        'series_group': row['series_group'],  # Optional grouping
+        'series_group_years': row['series_group_years'],  # Group year range
+        'issuing_entity': _issuing_entity(
+            row['country_code'], row['authority_name'], row['monetary_system'], row['currency_unit']
+        ),
+        'denomination': {
+            'face_value': row['face_value'],
+            'unit_name': row['unit_name'],
+            'common_names': common_names,
+            'system_fraction': row['system_fraction']
+        },
+        'issue_year': row['issue_year'],
+        'mint_id': row['mint_id'],
+        'specifications': specifications,
+        'sides': sides,
+        'mintage': mintage,
+        'rarity': row['rarity'],
+        'varieties': varieties
+    }
 
-            try:
-                common_names = json.loads(row_dict.get('common_names', '[]')) if row_dict.get('common_names') else []
-            except (json.JSONDecodeError, TypeError):
-                common_names = []
-
-            issue = {
-                'issue_id': row_dict['issue_id'],
-                'object_type': row_dict['object_type'],
-                'series_id': row_dict['series_id'],
-                'series_name': row_dict.get('series_id'),  # For display
-                'series_group': row_dict.get('series_group'),  # Optional grouping
-                'series_group_years': row_dict.get('series_group_years'),  # Group year range
-                'issuing_entity': {
-                    'country_code': row_dict['country_code'],
-                    'authority_name': row_dict.get('authority_name', 'Unknown'),
-                    'monetary_system': row_dict.get('monetary_system', 'Decimal'),
-                    'currency_unit': row_dict.get('currency_unit', 'Dollar')
-                },
-                'denomination': {
-                    'face_value': row_dict['face_value'],
-                    'unit_name': row_dict['unit_name'],
-                    'common_names': common_names,
-                    'system_fraction': row_dict.get('system_fraction')
-                },
-                'issue_year': row_dict['issue_year'],
-                'mint_id': row_dict.get('mint_id'),
-                'specifications': specifications,
-                'sides': sides,
-                'mintage': mintage,
-                'rarity': row_dict.get('rarity'),
-                'varieties': varieties
-            }
+    # Add optional fields
+    if row['date_range_start']:
+        issue['date_range_start'] = row['date_range_start']
+    if row['date_range_end']:
+        issue['date_range_end'] = row['date_range_end']
+    if row['notes']:
+        issue['notes'] = row['notes']
+    if row['source_citation']:
+        issue['source_citation'] = row['source_citation']
+
+    return issue
+
+
+def _export_country_issues(country, total_issues, rows, output_dir, ndjson=False):
+    """Stream one country's issue rows to <country>_issues.json.
+
+    With ndjson=True each issue is also written as one line of
+    <country>_issues.ndjson in the same pass. Returns the number of rows
+    written.
+    """
+    # Stream each issue to the file as its row arrives instead of holding
+    # the whole country in memory. The bytes match dumping
+    # {country_code, total_issues, issues} with _write_json.
+    header = _json_bytes({'country_code': country, 'total_issues': total_issues})
+    if _PRETTY:
+        opening, separator, first = header[:-2] + b',\n  "issues": [', b',\n', b'\n'
+        closing = b'\n  ]\n}' if total_issues else b']\n}'
+    else:
+        opening, separator, first, closing = header[:-1] + b',"issues":[', b',', b'', b']}'
+    written = 0
+    nd = open(f"{output_dir}/{country.lower()}_issues.ndjson", 'wb') if ndjson else None
+    try:
+        with open(f"{output_dir}/{country.lower()}_issues.json", 'wb') as f:
+            f.write(opening)
+            for row in rows:
+                issue = _build_issue(row)
+                f.write(separator if written else first)
+                f.write(_json_item(issue))
+                if nd:
+                    nd.write(_json_line(issue))
+                written += 1
+            f.write(closing)
+    finally:
+        if nd:
+            nd.close()
+    return written
+
+
+def export_issues_by_country(conn, output_dir, ndjson=False):
+    """Export issues grouped by country. Returns (country_code, issue_count) pairs."""
+    cursor = conn.cursor()
+    
+    # Get countries with their issue counts; each file's header needs its
+    # total before the issues are streamed
+    cursor.execute('''
+        SELECT country_code, COUNT(*) FROM issues
+        GROUP BY country_code
+        ORDER BY country_code
+    ''')
+    country_counts = cursor.fetchall()
+    remaining = dict(country_counts)
+    
+    # One scan in country order instead of a query per country. Both
+    # statements run on conn, inside the caller's read snapshot, so the
+    # counts and the scan see the same rows.
+    cursor.execute('''
+        SELECT issue_id, object_type, series_id, series_group, series_group_years,
+               country_code, authority_name, monetary_system, currency_unit,
+               face_value, unit_name, common_names, system_fraction, issue_year,
+               mint_id, date_range_start, date_range_end, specifications, sides,
+               mintage, rarity, varieties, source_citation, notes
+        FROM issues
+        ORDER BY country_code, issue_year, face_value
+    ''')
+    for country, rows in groupby(cursor, key=itemgetter('country_code')):
+        total_issues = remaining.pop(country, 0)
+        written = _export_country_issues(country, total_issues, rows, output_dir, ndjson)
+        if written != total_issues:
+            raise ValueError(f"{country}: counted {total_issues} issues but exported {written}")
+        print(f"✓ Exported {total_issues} {country} issues")
+    
+    if remaining:
+        raise ValueError(f"Counted issues were not exported for: {', '.join(remaining)}")
+    
+    return country_counts
 
-            # Add optional fields
-            if row_dict.get('date_range_start'):
-                issue['date_range_start'] = row_dict['date_range_start']
-            if row_dict.get('date_range_end'):
-                issue['date_range_end'] = row_dict['date_range_end']
-            if row_dict.get('notes'):
-                issue['notes'] = row_dict['notes']
-            if row_dict.get('source_citation'):
-                issue['source_citation'] = row_dict['source_citation']
-
-            issues.append(issue)
-        
-        country_data = {
-            'country_code': country,
-            'total_issues': len(issues),
-            'issues': issues
-        }
-        
-        with open(f"{output_dir}/{country.lower()}_issues.json", 'w') as f:
-            json.dump(country_data, f, indent=2)
-        print(f"✓ Exported {len(issues)} {country} issues")
 
+def export_complete_universal_dataset(conn, output_dir, country_counts=None):
+    """Export complete universal dataset.
 
-def export_complete_universal_dataset(conn, output_dir):
-    """Export complete universal dataset."""
+    country_counts are the (country_code, issue_count) pairs returned by
+    export_issues_by_country; they are queried when not given.
+    """
     cursor = conn.cursor()
     
-    # Get summary statistics
-    cursor.execute('SELECT COUNT(*) FROM issues')
-    total_issues = cursor.fetchone()[0]
-    
-    cursor.execute('SELECT COUNT(DISTINCT country_code) FROM issues')
-    total_countries = cursor.fetchone()[0]
+    if country_counts is None:
+        cursor.execute('''
+            SELECT country_code, COUNT(*) FROM issues
+            GROUP BY country_code
+            ORDER BY country_code
+        ''')
+        country_counts = cursor.fetchall()
     
-    cursor.execute('SELECT COUNT(DISTINCT object_type) FROM issues')
-    total_types = cursor.fetchone()[0]
+    # Get summary statistics
+    total_issues = sum(count for _, count in country_counts)
+    total_countries = len(country_counts)
     
-    cursor.execute('SELECT MIN(issue_year), MAX(issue_year) FROM issues')
-    year_range = cursor.fetchone()
+    cursor.execute('SELECT COUNT(DISTINCT object_type), MIN(issue_year), MAX(issue_year) FROM issues')
+    total_types, earliest_year, latest_year = cursor.fetchone()
     
     # Build summary
     summary = {
@@ -398,8 +539,8 @@ def export_complete_universal_dataset(conn, output_dir):
         'countries': total_countries,
         'object_types': total_types,
         'year_range': {
-            'earliest': year_range[0],
-            'latest': year_range[1]
+            'earliest': earliest_year,
+            'latest': latest_year
         },
         'registries': {
             'subjects': 'subject_registry.json',
@@ -410,40 +551,44 @@ def export_complete_universal_dataset(conn, output_dir):
     }
     
     # Add issue file references
-    cursor.execute('SELECT DISTINCT country_code FROM issues ORDER BY country_code')
-    for row in cursor.fetchall():
-        country = row[0]
+    for country, _ in country_counts:
         summary['issue_files'].append(f"{country.lower()}_issues.json")
     
-    with open(f"{output_dir}/taxonomy_summary.json", 'w') as f:
-        json.dump(summary, f, indent=2)
+    _write_json(f"{output_dir}/taxonomy_summary.json", summary)
     print(f"✓ Exported universal taxonomy summary")
 
 
 def get_face_value(denomination):
     """Get face value for denomination."""
-    values = {
-        'Cents': 0.01,
-        'Nickels': 0.05,
-        'Dimes': 0.10,
-        'Quarters': 0.25,
-        'Half Dollars': 0.50,
-        'Dollars': 1.00
-    }
-    return values.get(denomination, 0.0)
+    return FACE_VALUES.get(denomination, 0.0)
 
 
 def main():
     """Main export function."""
+    parser = argparse.ArgumentParser(description='Universal Currency Taxonomy Export v1.1')
+    parser.add_argument('--ndjson', action='store_true',
+                        help='Also write <country>_issues.ndjson with one issue per line')
+    parser.add_argument('--bundle', action='store_true',
+                        help='Write the legacy files into data/legacy.tar.zst instead of data/<country>/coins/')
+    parser.add_argument('--compact', action='store_true',
+                        help='Write minified JSON instead of 2-space indented files')
+    args = parser.parse_args()
+    
+    global _PRETTY
+    _PRETTY = not args.compact
+    
     print("Universal Currency Taxonomy Export v1.1")
     print("=" * 50)
     
-    # Connect to database
-    conn = sqlite3.connect('database/coins.db')
-    conn.row_factory = sqlite3.Row
+    # Connect to database; both formats share this connection, so give it a
+    # larger page cache than the single-format exports use
+    conn = open_readonly('database/coins.db', cache_mib=256)
     cursor = conn.cursor()
     cursor.execute('PRAGMA foreign_keys = ON;')  # Enable foreign key enforcement
     
+    # Run every export query against one read snapshot
+    cursor.execute('BEGIN DEFERRED')
+    
     # Check available table structures
     has_universal = check_universal_tables(conn)
     has_legacy = check_legacy_tables(conn)
@@ -453,13 +598,16 @@ def main():
     print()
     
     if has_universal:
-        export_universal_format(conn)
+        export_universal_format(conn, ndjson=args.ndjson)
     
     if has_legacy:
-        export_legacy_format(conn)
+        export_legacy_format(conn, bundle=args.bundle)
+    
+    conn.rollback()  # End the read transaction; nothing was written
     
     if not has_universal and not has_legacy:
         print("Error: No compatible table structure found.")
+        conn.close()
         return
     
     conn.close()
@@ -12,23 +12,81 @@ SQLite Database (SOURCE OF TRUTH) → JSON Export Files
 (version controlled)             (version controlled)
 
 Usage:
-    python scripts/export_from_database.py
+    python scripts/export_from_database.py [--arrow] [--ndjson]
 """
 
+import argparse
+import importlib
 import sqlite3
 import json
 import os
 from datetime import datetime
+from itertools import groupby
+from operator import itemgetter
 from typing import Dict, List, Any
 from pathlib import Path
+
+import orjson
+
 from json_validator import JSONValidator
 
+
+# Face value in dollars per denomination
+FACE_VALUES = {
+    'Half Cents': 0.005,
+    'Cents': 0.01,
+    'Three Cents': 0.03,
+    'Nickels': 0.05,
+    'Dimes': 0.10,
+    'Twenty Cents': 0.20,
+    'Quarters': 0.25,
+    'Quarter Dollar': 0.25,  # Support both naming conventions
+    'Half Dollars': 0.50,
+    'Dollars': 1.00,
+    'Trade Dollars': 1.00,
+    'Gold Dollars': 1.00,
+    'Quarter Eagles': 2.50,
+    'Three Dollar Gold': 3.00,
+    'Half Eagles': 5.00,
+    'Eagles': 10.00,
+    'Double Eagles': 20.00
+}
+
+def _json_line(obj):
+    """Serialize obj as one compact NDJSON line."""
+    return orjson.dumps(obj, option=orjson.OPT_APPEND_NEWLINE)
+
+# Column types for us_coins_complete.arrow; everything not listed is a string
+ARROW_COLUMN_TYPES = {
+    'business_strikes': 'int64',
+    'proof_strikes': 'int64',
+    'weight_grams': 'float64',
+    'diameter_mm': 'float64',
+}
+
 class DatabaseExporter:
-    def __init__(self, db_path='database/coins.db'):
+    def __init__(self, db_path='database/coins.db', arrow=False, ndjson=False):
         self.db_path = db_path
         self.output_dir = 'data/us/coins'
         self.validator = JSONValidator()
+        self.arrow = arrow  # Also write a columnar us_coins_complete.arrow (needs pyarrow)
+        self.ndjson = ndjson  # Also write us_coins_complete_rows.ndjson, one coin per line
+        self._composition_cache = {}  # composition text -> parsed dict (shared by every coin using it)
         
+    def connect(self):
+        """Open the database with pragmas tuned for read-only export queries."""
+        conn = sqlite3.connect(self.db_path)
+        # mmap the file, keep up to 64 MiB of pages cached and sort in memory.
+        # journal_mode/synchronous are left alone since they only matter to
+        # writers and WAL would rewrite the checked-in database file.
+        conn.executescript("""
+            PRAGMA query_only=1;
+            PRAGMA temp_store=MEMORY;
+            PRAGMA mmap_size=268435456;
+            PRAGMA cache_size=-65536;
+        """)
+        return conn
+    
     def ensure_output_dir(self):
         """Ensure output directory exists."""
         os.makedirs(self.output_dir, exist_ok=True)
@@ -45,71 +103,76 @@ class DatabaseExporter:
         
     def export_coins_by_denomination(self):
         """Export coins grouped by denomination to separate JSON files."""
-        conn = sqlite3.connect(self.db_path)
+        conn = self.connect()
         cursor = conn.cursor()
         
         try:
             print("📊 Exporting coins by denomination from database...")
             
-            # Get US denominations only
+            # Series aliases by (series_name, denomination); the first registry
+            # row wins, as with the former per-series lookup
             cursor.execute('''
-                SELECT DISTINCT denomination, COUNT(*) as count
-                FROM coins 
+                SELECT series_name, denomination, aliases FROM series_registry
+                ORDER BY rowid
+            ''')
+            registry_aliases = {}
+            for series_name, denomination, aliases in cursor:
+                registry_aliases.setdefault((series_name, denomination), aliases)
+            
+            # All US coins in one scan (using ACTUAL database columns), ordered
+            # by denomination so each denomination's rows group off the cursor
+            cursor.execute('''
+                SELECT
+                    coin_id,
+                    series,
+                    series as series_name,
+                    year,
+                    mint,
+                    business_strikes,
+                    proof_strikes,
+                    total_mintage,
+                    rarity,
+                    composition,
+                    weight_grams,
+                    diameter_mm,
+                    variety as varieties,
+                    source_citation,
+                    notes,
+                    substr(coin_id, 1, 2) as country,
+                    obverse_description,
+                    reverse_description,
+                    designer,
+                    '' as distinguishing_features,
+                    '' as identification_keywords,
+                    '' as common_names,
+                    'coin' as category,
+                    '' as issuer,
+                    year as series_year,
+                    'gregorian' as calendar_type,
+                    '' as original_date,
+                    '' as variety_suffix,
+                    CASE
+                        WHEN denomination LIKE '%Commemorative%' THEN 'commemorative'
+                        WHEN denomination LIKE '%Engelhard%' THEN 'private_bullion'
+                        WHEN series LIKE '%Eagle%' AND (denomination LIKE '$%' OR denomination LIKE '%Dollar%') THEN 'sovereign_bullion'
+                        WHEN series LIKE '%Buffalo%' AND denomination LIKE '$%' THEN 'sovereign_bullion'
+                        WHEN composition LIKE '%silver%' OR composition LIKE '%gold%' THEN 'numismatic'
+                        ELSE 'circulation'
+                    END as subcategory,
+                    denomination
+                FROM coins
                 WHERE coin_id LIKE 'US-%'
-                GROUP BY denomination 
-                ORDER BY denomination
+                ORDER BY denomination, year, series, mint
             ''')
             
-            denominations = cursor.fetchall()
+            # Rows are grouped on the trailing denomination column, looked up
+            # by name so the key cannot drift from the SELECT list
+            columns = [description[0] for description in cursor.description]
+            denomination_of = itemgetter(columns.index('denomination'))
             
-            for denom_name, count in denominations:
-                print(f"📄 Exporting {denom_name}: {count} coins")
-                
-                # Get all coins for this denomination - using ACTUAL database columns
-                cursor.execute('''
-                    SELECT
-                        coin_id,
-                        series,
-                        series as series_name,
-                        year,
-                        mint,
-                        business_strikes,
-                        proof_strikes,
-                        total_mintage,
-                        rarity,
-                        composition,
-                        weight_grams,
-                        diameter_mm,
-                        variety as varieties,
-                        source_citation,
-                        notes,
-                        substr(coin_id, 1, 2) as country,
-                        obverse_description,
-                        reverse_description,
-                        designer,
-                        '' as distinguishing_features,
-                        '' as identification_keywords,
-                        '' as common_names,
-                        'coin' as category,
-                        '' as issuer,
-                        year as series_year,
-                        'gregorian' as calendar_type,
-                        '' as original_date,
-                        '' as variety_suffix,
-                        CASE
-                            WHEN denomination LIKE '%Commemorative%' THEN 'commemorative'
-                            WHEN denomination LIKE '%Engelhard%' THEN 'private_bullion'
-                            WHEN series LIKE '%Eagle%' AND (denomination LIKE '$%' OR denomination LIKE '%Dollar%') THEN 'sovereign_bullion'
-                            WHEN series LIKE '%Buffalo%' AND denomination LIKE '$%' THEN 'sovereign_bullion'
-                            WHEN composition LIKE '%silver%' OR composition LIKE '%gold%' THEN 'numismatic'
-                            ELSE 'circulation'
-                        END as subcategory
-                    FROM coins
-                    WHERE denomination = ? AND coin_id LIKE 'US-%'
-                    ORDER BY year, series, mint
-                ''', (denom_name,))
-                
-                rows = cursor.fetchall()
+            for denom_name, denom_rows in groupby(cursor, key=denomination_of):
+                rows = list(denom_rows)
+                print(f"📄 Exporting {denom_name}: {len(rows)} coins")
                 
                 # Group coins by series
                 series_data = {}
@@ -223,14 +286,10 @@ class DatabaseExporter:
                                 series_entry["series_code"] = parts[1]
 
                     # Look up aliases from series_registry
-                    cursor.execute('''
-                        SELECT aliases FROM series_registry
-                        WHERE series_name = ? AND denomination = ?
-                    ''', (series_id, denom_name))
-                    registry_row = cursor.fetchone()
-                    if registry_row and registry_row[0]:
+                    registry_aliases_json = registry_aliases.get((series_id, denom_name))
+                    if registry_aliases_json:
                         try:
-                            aliases = json.loads(registry_row[0])
+                            aliases = json.loads(registry_aliases_json)
                             if aliases:
                                 series_entry["aliases"] = aliases
                         except json.JSONDecodeError:
@@ -267,26 +326,7 @@ class DatabaseExporter:
     
     def get_face_value(self, denomination: str) -> float:
         """Get face value for denomination."""
-        face_values = {
-            'Half Cents': 0.005,
-            'Cents': 0.01,
-            'Three Cents': 0.03,
-            'Nickels': 0.05,
-            'Dimes': 0.10,
-            'Twenty Cents': 0.20,
-            'Quarters': 0.25,
-            'Quarter Dollar': 0.25,  # Support both naming conventions
-            'Half Dollars': 0.50,
-            'Dollars': 1.00,
-            'Trade Dollars': 1.00,
-            'Gold Dollars': 1.00,
-            'Quarter Eagles': 2.50,
-            'Three Dollar Gold': 3.00,
-            'Half Eagles': 5.00,
-            'Eagles': 10.00,
-            'Double Eagles': 20.00
-        }
-        return face_values.get(denomination, 1.00)
+        return FACE_VALUES.get(denomination, 1.00)
     
     def format_varieties(self, varieties):
         """Format varieties to match schema requirements."""
@@ -329,6 +369,19 @@ class DatabaseExporter:
         }]
 
     def parse_composition(self, composition_text):
+        """Parse composition text, once per distinct value.
+
+        Coins share a few dozen composition strings, so the parsed dicts are
+        cached and shared between coins; exports only serialize them.
+        """
+        try:
+            return self._composition_cache[composition_text]
+        except KeyError:
+            composition = self.parse_composition_text(composition_text)
+            self._composition_cache[composition_text] = composition
+            return composition
+
+    def parse_composition_text(self, composition_text):
         """Parse composition from either JSON format or text format."""
         if not composition_text:
             return {}
@@ -489,7 +542,7 @@ class DatabaseExporter:
         """Export paper currency from issues table to JSON files."""
         print("💵 Exporting paper currency from database...")
         
-        conn = sqlite3.connect(self.db_path)
+        conn = self.connect()
         cursor = conn.cursor()
         
         try:
@@ -700,11 +753,53 @@ class DatabaseExporter:
         }
         return filenames.get(denomination, f"{denomination.lower().replace(' ', '_').replace('$', 'dollar_')}.json")
     
+    def build_complete_coin(self, row):
+        """Build one us_coins_complete.json coin entry from a coins row."""
+        coin = {
+            "coin_id": row[0],
+            "series_id": row[1],
+            "series_name": row[2],
+            "denomination": row[3],
+            "year": row[4],
+            "mint": row[5],
+            "business_strikes": row[6],
+            "proof_strikes": row[7],
+            "rarity": row[8],
+            "composition": self.parse_composition(row[9]),
+            "weight_grams": row[10],
+            "diameter_mm": row[11],
+            "varieties": self.format_single_variety(row[12]) if row[12] and row[12].strip() else [],
+            "source_citation": row[13],
+            "notes": row[14],
+            "country": row[15]
+        }
+        
+        # Add visual description fields
+        if row[16]:  # obverse_description
+            coin["obverse_description"] = row[16]
+        if row[17]:  # reverse_description
+            coin["reverse_description"] = row[17]
+        if row[18]:  # distinguishing_features (text field, not JSON)
+            coin["distinguishing_features"] = row[18]
+        if row[19]:  # identification_keywords (text field, not JSON)
+            coin["identification_keywords"] = row[19]
+        if row[20]:  # common_names (text field, not JSON)
+            coin["common_names"] = row[20]
+        
+        return coin
+    
+    def tee_ndjson(self, coins, ndjson_path):
+        """Yield coins unchanged while writing each one as a line of ndjson_path."""
+        with open(ndjson_path, 'wb') as f:
+            for coin in coins:
+                f.write(_json_line(coin))
+                yield coin
+    
     def export_complete_file(self):
         """Export complete us_coins_complete.json file."""
         print("📄 Exporting complete US coins file...")
         
-        conn = sqlite3.connect(self.db_path)
+        conn = self.connect()
         cursor = conn.cursor()
         
         try:
@@ -746,41 +841,6 @@ class DatabaseExporter:
                 ORDER BY year, denomination, series, mint
             ''')
             
-            coins = []
-            for row in cursor.fetchall():
-                coin = {
-                    "coin_id": row[0],
-                    "series_id": row[1],
-                    "series_name": row[2],
-                    "denomination": row[3],
-                    "year": row[4],
-                    "mint": row[5],
-                    "business_strikes": row[6],
-                    "proof_strikes": row[7],
-                    "rarity": row[8],
-                    "composition": self.parse_composition(row[9]),
-                    "weight_grams": row[10],
-                    "diameter_mm": row[11],
-                    "varieties": self.format_single_variety(row[12]) if row[12] and row[12].strip() else [],
-                    "source_citation": row[13],
-                    "notes": row[14],
-                    "country": row[15]
-                }
-                
-                # Add visual description fields
-                if row[16]:  # obverse_description
-                    coin["obverse_description"] = row[16]
-                if row[17]:  # reverse_description
-                    coin["reverse_description"] = row[17]
-                if row[18]:  # distinguishing_features (text field, not JSON)
-                    coin["distinguishing_features"] = row[18]
-                if row[19]:  # identification_keywords (text field, not JSON)
-                    coin["identification_keywords"] = row[19]
-                if row[20]:  # common_names (text field, not JSON)
-                    coin["common_names"] = row[20]
-                
-                coins.append(coin)
-            
             complete_data = {
                 "taxonomy_version": "1.1",
                 "generated_at": datetime.now().isoformat(),
@@ -788,13 +848,24 @@ class DatabaseExporter:
                 "year_range": {
                     "earliest": stats[1],
                     "latest": stats[2]
-                },
-                "coins": coins
+                }
             }
             
+            # Stream coins straight from the cursor into the file instead of
+            # materializing every row and coin dict first
+            coins = (self.build_complete_coin(row) for row in cursor)
+            # Each line is one entry of the JSON file's "coins" array, with the
+            # same keys. The name differs from export_us_complete.py --ndjson,
+            # whose us_coins_complete.ndjson holds the nested taxonomy's coins.
+            ndjson_path = Path('data/us/us_coins_complete_rows.ndjson')
+            if self.ndjson:
+                # Same pass, one coin per line for streaming consumers
+                coins = self.tee_ndjson(coins, ndjson_path)
             filepath = Path('data/us/us_coins_complete.json')
-            if self.validator.safe_json_write(complete_data, filepath):
+            if self.validator.safe_json_write_stream(complete_data, 'coins', coins, filepath):
                 print(f"   ✅ {filepath}")
+                if self.ndjson:
+                    print(f"   ✅ {ndjson_path}")
             else:
                 print(f"   ❌ {filepath} - JSON validation failed")
                 self.validator.print_errors()
@@ -805,6 +876,68 @@ class DatabaseExporter:
         finally:
             conn.close()
     
+    def export_complete_arrow(self):
+        """Export data/us/us_coins_complete.arrow, a columnar copy of the coins table.
+
+        Columns are filled straight from the query rows without building a dict
+        per coin or going through JSON; composition and varieties stay as the
+        raw database text. Returns the written path, or None when pyarrow is not
+        installed.
+        """
+        print("📄 Exporting columnar US coins file...")
+        
+        try:
+            pa = importlib.import_module('pyarrow')
+            importlib.import_module('pyarrow.ipc')
+        except ImportError:
+            print("   ⚠️  pyarrow not installed, skipping Arrow output...")
+            return None
+        
+        conn = self.connect()
+        cursor = conn.cursor()
+        
+        try:
+            cursor.execute('''
+                SELECT 
+                    coin_id, 
+                    series as series_id, 
+                    denomination,
+                    year, 
+                    mint, 
+                    business_strikes, 
+                    proof_strikes, 
+                    rarity,
+                    composition, 
+                    weight_grams, 
+                    diameter_mm,
+                    variety as varieties, 
+                    source_citation, 
+                    notes, 
+                    substr(coin_id, 1, 2) as country,
+                    obverse_description, 
+                    reverse_description
+                FROM coins
+                ORDER BY year, denomination, series, mint
+            ''')
+            
+            names = [description[0] for description in cursor.description]
+            columns = list(zip(*cursor.fetchall())) or [()] * len(names)
+            table = pa.table({
+                name: pa.array(column, type=ARROW_COLUMN_TYPES.get(name, 'string'))
+                for name, column in zip(names, columns)
+            })
+            
+            filepath = Path('data/us/us_coins_complete.arrow')
+            with pa.OSFile(str(filepath), 'wb') as sink, pa.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+            print(f"   ✅ {filepath} ({table.num_rows} coins)")
+            return filepath
+            
+        except sqlite3.Error as e:
+            print(f"❌ Error exporting Arrow file: {e}")
+        finally:
+            conn.close()
+    
     def export_ai_taxonomy(self):
         """Export AI-optimized taxonomy with minimal token usage."""
         print("🤖 Exporting AI-optimized taxonomy...")
@@ -828,7 +961,7 @@ class DatabaseExporter:
         """Export grade standards from database to JSON (Issue #64)."""
         print("📊 Exporting grade standards from database...")
 
-        conn = sqlite3.connect(self.db_path)
+        conn = self.connect()
         cursor = conn.cursor()
 
         try:
@@ -958,7 +1091,7 @@ class DatabaseExporter:
         """Export coin inventory from database to JSON (Issue #65)."""
         print("📊 Exporting coin inventory from database...")
 
-        conn = sqlite3.connect(self.db_path)
+        conn = self.connect()
         cursor = conn.cursor()
 
         try:
@@ -1087,7 +1220,7 @@ class DatabaseExporter:
             return False
         
         # Check database has data
-        conn = sqlite3.connect(self.db_path)
+        conn = self.connect()
         cursor = conn.cursor()
         cursor.execute("SELECT COUNT(*) FROM coins WHERE coin_id LIKE 'US-%'")
         coin_count = cursor.fetchone()[0]
@@ -1108,6 +1241,8 @@ class DatabaseExporter:
         
         # Export complete file
         self.export_complete_file()
+        if self.arrow:
+            self.export_complete_arrow()
 
         # Export AI-optimized taxonomy
         self.export_ai_taxonomy()
@@ -1131,7 +1266,15 @@ class DatabaseExporter:
             return False
 
 def main():
-    exporter = DatabaseExporter()
+    parser = argparse.ArgumentParser(description='Export JSON files from the SQLite database')
+    parser.add_argument('--arrow', action='store_true',
+                        help='Also write data/us/us_coins_complete.arrow (requires pyarrow)')
+    parser.add_argument('--ndjson', action='store_true',
+                        help='Also write data/us/us_coins_complete_rows.ndjson: each entry of '
+                             'us_coins_complete.json\'s "coins" array as one line')
+    args = parser.parse_args()
+    
+    exporter = DatabaseExporter(arrow=args.arrow, ndjson=args.ndjson)
     
     try:
         success = exporter.run_export()
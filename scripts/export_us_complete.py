@@ -4,15 +4,63 @@ Export complete US coin taxonomy to a single comprehensive JSON file.
 Combines all individual denomination files into one unified structure.
 """
 
-import json
+import argparse
 import glob
 import os
 from datetime import datetime
 
+import orjson
+
+# Handle imports for both direct execution and module import
+try:
+    from scripts.utils.export_io import dumps_ascii
+except ModuleNotFoundError:
+    from utils.export_io import dumps_ascii
+
+def _write_json(path, obj):
+    """Write obj to path as 2-space indented, \\u-escaped JSON in a single write"""
+    data = dumps_ascii(obj)
+    with open(path, 'wb') as f:
+        f.write(data)
+
+def _write_ndjson(path, records):
+    """Write records to path as newline-delimited compact JSON"""
+    with open(path, 'wb') as f:
+        for record in records:
+            f.write(orjson.dumps(record, option=orjson.OPT_APPEND_NEWLINE))
+
+def write_ndjson_taxonomy(output_file, complete_taxonomy):
+    """Write the taxonomy as one coin per line plus a small metadata file.
+
+    Each line carries its denomination and series_id. Everything except the
+    coins (metadata, series details, references, statistics) goes to
+    <name>_meta.json next to the .ndjson file.
+    """
+    meta = {key: value for key, value in complete_taxonomy.items() if key != 'denominations'}
+    meta['denominations'] = {
+        denomination: {
+            "face_value": data['face_value'],
+            "series": [{k: v for k, v in series.items() if k != 'coins'} for series in data['series']]
+        }
+        for denomination, data in complete_taxonomy['denominations'].items()
+    }
+    
+    coins = (
+        {"denomination": denomination, "series_id": series.get('series_id'), **coin}
+        for denomination, data in complete_taxonomy['denominations'].items()
+        for series in data['series']
+        for coin in series.get('coins', [])
+    )
+    
+    meta_file = os.path.splitext(output_file)[0] + '_meta.json'
+    _write_ndjson(output_file, coins)
+    _write_json(meta_file, meta)
+    return meta_file
+
 def load_composition_data():
     """Load and resolve composition references"""
-    with open('data/us/references/compositions.json') as f:
-        compositions_data = json.load(f)
+    with open('data/us/references/compositions.json', 'rb') as f:
+        compositions_data = orjson.loads(f.read())
     return compositions_data['common_alloys']
 
 def resolve_composition(period, compositions):
@@ -29,8 +77,12 @@ def resolve_composition(period, compositions):
     # Return as-is if already has full composition or no key
     return period
 
-def export_complete_us_taxonomy(output_file='data/us/us_coins_complete.json'):
-    """Export complete US coin taxonomy to a single JSON file"""
+def export_complete_us_taxonomy(output_file='data/us/us_coins_complete.json', ndjson=False):
+    """Export complete US coin taxonomy to a single JSON file
+
+    With ndjson=True the coins are written one per line to a .ndjson file
+    instead, with the remaining structure in a separate _meta.json file.
+    """
     
     # Load composition data for reference resolution
     compositions = load_composition_data()
@@ -59,8 +111,8 @@ def export_complete_us_taxonomy(output_file='data/us/us_coins_complete.json'):
     for filepath in sorted(coin_files):
         print(f"Processing {filepath}...")
         
-        with open(filepath) as f:
-            data = json.load(f)
+        with open(filepath, 'rb') as f:
+            data = orjson.loads(f.read())
         
         denomination = data['denomination']
         
@@ -96,8 +148,8 @@ def export_complete_us_taxonomy(output_file='data/us/us_coins_complete.json'):
     
     for ref_name, ref_path in reference_files.items():
         if os.path.exists(ref_path):
-            with open(ref_path) as f:
-                complete_taxonomy['references'][ref_name] = json.load(f)
+            with open(ref_path, 'rb') as f:
+                complete_taxonomy['references'][ref_name] = orjson.loads(f.read())
     
     # Add statistics
     complete_taxonomy['statistics'] = {
@@ -112,8 +164,12 @@ def export_complete_us_taxonomy(output_file='data/us/us_coins_complete.json'):
     os.makedirs(os.path.dirname(output_file), exist_ok=True)
     
     # Write to file
-    with open(output_file, 'w') as f:
-        json.dump(complete_taxonomy, f, indent=2)
+    if ndjson:
+        output_file = os.path.splitext(output_file)[0] + '.ndjson'
+        meta_file = write_ndjson_taxonomy(output_file, complete_taxonomy)
+        print(f"📝 Metadata written to {meta_file}")
+    else:
+        _write_json(output_file, complete_taxonomy)
     
     # Calculate file size
     file_size_kb = os.path.getsize(output_file) / 1024
@@ -130,6 +186,11 @@ def export_complete_us_taxonomy(output_file='data/us/us_coins_complete.json'):
 
 def main():
     """Main export function"""
+    parser = argparse.ArgumentParser(description='Export the complete US coin taxonomy')
+    parser.add_argument('--ndjson', action='store_true',
+                        help='Write one coin per line (.ndjson) plus a _meta.json file')
+    args = parser.parse_args()
+    
     print("🪙 Generating complete US coin taxonomy file...")
     
     # Check if source files exist
@@ -141,7 +202,7 @@ def main():
     print(f"📁 Found {len(coin_files)} denomination files")
     
     # Export the complete taxonomy
-    output_file = export_complete_us_taxonomy()
+    output_file = export_complete_us_taxonomy(ndjson=args.ndjson)
     
     print(f"\n🎉 Complete! File available at: {output_file}")
 
@@ -9,9 +9,11 @@ Ensures all generated JSON files are valid and properly formatted.
 import json
 import jsonschema
 from pathlib import Path
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Iterable
 import sys
 
+import orjson
+
 class JSONValidator:
     """Standardized JSON validator for all coin taxonomy exports."""
     
@@ -58,8 +60,8 @@ class JSONValidator:
             bool: True if valid, False otherwise
         """
         try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                json.load(f)
+            with open(filepath, 'rb') as f:
+                orjson.loads(f.read())
             return True
             
         except (json.JSONDecodeError, FileNotFoundError, UnicodeDecodeError) as e:
@@ -115,8 +117,11 @@ class JSONValidator:
         Returns:
             bool: True if successful, False otherwise
         """
-        # Validate JSON syntax first
-        if not self.validate_json_syntax(data, str(filepath)):
+        # Encode once up front; this doubles as the JSON syntax check
+        try:
+            payload = self._encode_sorted(data, indent)
+        except (TypeError, ValueError) as e:
+            self.errors.append(f"JSON validation failed for {filepath}: {e}")
             return False
         
         # Validate taxonomy structure if applicable
@@ -131,8 +136,8 @@ class JSONValidator:
             # Write with atomic operation (temp file + rename)
             temp_filepath = filepath.with_suffix('.tmp')
             
-            with open(temp_filepath, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=indent, ensure_ascii=False, sort_keys=True)
+            with open(temp_filepath, 'wb') as f:
+                f.write(payload)
             
             # Verify written file is valid
             if not self.validate_json_file(temp_filepath):
@@ -144,9 +149,82 @@ class JSONValidator:
             
             return True
             
-        except (OSError, json.JSONEncodeError) as e:
+        except OSError as e:
+            self.errors.append(f"Failed to write {filepath}: {e}")
+            return False
+    
+    def _encode_sorted(self, data: Any, indent: int) -> bytes:
+        """Encode data as indented JSON bytes with sorted keys and raw UTF-8."""
+        if indent == 2:
+            try:
+                return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS)
+            except TypeError:
+                pass  # e.g. integers beyond 64 bits; let the stdlib encoder handle it
+        return json.dumps(data, indent=indent, ensure_ascii=False, sort_keys=True).encode('utf-8')
+    
+    def safe_json_write_stream(self, data: Dict[str, Any], items_key: str,
+                               items: Iterable[Any], filepath: Path, indent: int = 2) -> bool:
+        """
+        Write data plus a streamed list under items_key, without building the list.
+        
+        The file is byte-for-byte what safe_json_write would produce for
+        dict(data, **{items_key: list(items)}), but items are encoded and
+        written one at a time, so memory stays flat for large exports.
+        
+        Args:
+            data: Top-level fields other than the streamed list
+            items_key: Key the streamed items are written under
+            items: Iterable of items (consumed once)
+            filepath: Output file path
+            indent: JSON indentation (default: 2)
+        
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        # Lay out the envelope with a placeholder where the list goes
+        marker = json.dumps('\x00stream\x00').encode('utf-8')
+        envelope = self._encode_sorted(dict(data, **{items_key: '\x00stream\x00'}), indent)
+        head, tail = envelope.split(marker)
+        line = head[head.rfind(b'\n') + 1:]
+        key_pad = line[:len(line) - len(line.lstrip(b' '))]
+        item_pad = key_pad + b' ' * indent
+        
+        temp_filepath = filepath.with_suffix('.tmp')
+        try:
+            # Create parent directory if needed
+            filepath.parent.mkdir(parents=True, exist_ok=True)
+            
+            with open(temp_filepath, 'wb') as f:
+                f.write(head + b'[')
+                count = 0
+                for item in items:
+                    # Same per-entry checks validate_coin_taxonomy_structure applies
+                    if items_key == 'coins' and (not isinstance(item, dict) or 'coin_id' not in item):
+                        self.errors.append(f"Coin entry {count} must be a dictionary with a 'coin_id'")
+                        temp_filepath.unlink(missing_ok=True)
+                        return False
+                    f.write(b',\n' if count else b'\n')
+                    f.write(item_pad + self._encode_sorted(item, indent).replace(b'\n', b'\n' + item_pad))
+                    count += 1
+                f.write((b'\n' + key_pad + b']' if count else b']') + tail)
+            
+            # Verify written file is valid
+            if not self.validate_json_file(temp_filepath):
+                temp_filepath.unlink(missing_ok=True)
+                return False
+            
+            # Atomic rename
+            temp_filepath.rename(filepath)
+            
+            return True
+        
+        except (OSError, TypeError, ValueError) as e:
+            temp_filepath.unlink(missing_ok=True)
             self.errors.append(f"Failed to write {filepath}: {e}")
             return False
+        except BaseException:
+            temp_filepath.unlink(missing_ok=True)
+            raise
     
     def get_errors(self) -> List[str]:
         """Get list of validation errors."""
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Shared I/O helpers for the database export scripts.
+
+Encodes JSON with orjson while keeping the output byte-for-byte what
+json.dump writes by default (ASCII with \\u escapes), so regenerated files
+match the checked-in ones, and opens the database for read-only bulk exports.
+
+Usage:
+    from scripts.utils.export_io import dumps_ascii, open_readonly
+
+    conn = open_readonly('database/coins.db')
+    data = dumps_ascii({'country': 'US'})
+"""
+
+import re
+import sqlite3
+
+import orjson
+
+
+# Runs of bytes that json.dumps escapes by default: DEL and UTF-8 sequences
+_NON_ASCII_RUN = re.compile(rb'[\x7f-\xff]+')
+
+
+def _escape_run(match):
+    """Return a run of UTF-8 bytes as \\uXXXX escapes (surrogate pairs above U+FFFF)."""
+    escaped = []
+    for char in match.group().decode('utf-8'):
+        code = ord(char)
+        if code > 0xFFFF:
+            code -= 0x10000
+            escaped.append('\\u%04x\\u%04x' % (0xD800 | (code >> 10), 0xDC00 | (code & 0x3FF)))
+        else:
+            escaped.append('\\u%04x' % code)
+    return ''.join(escaped).encode('ascii')
+
+
+def dumps_ascii(obj, pretty: bool = True) -> bytes:
+    """
+    Serialize obj to \\u-escaped ASCII JSON bytes.
+
+    Args:
+        obj: Data to serialize
+        pretty: 2-space indented like json.dumps(obj, indent=2) when True,
+            otherwise compact like json.dumps(obj, separators=(',', ':'))
+
+    Returns:
+        bytes: The encoded JSON
+    """
+    option = orjson.OPT_INDENT_2 if pretty else None
+    return _NON_ASCII_RUN.sub(_escape_run, orjson.dumps(obj, option=option))
+
+
+def open_readonly(db_path, cache_mib: int = 64) -> sqlite3.Connection:
+    """
+    Open db_path with pragmas tuned for a read-only bulk export.
+
+    Args:
+        db_path: Path to the SQLite database
+        cache_mib: Page cache size in MiB
+
+    Returns:
+        sqlite3.Connection: Connection returning sqlite3.Row rows
+    """
+    conn = sqlite3.connect(db_path)
+    # mmap the file and sort in memory. journal_mode/synchronous are left
+    # alone since they only matter to writers and WAL would rewrite the
+    # checked-in database file.
+    conn.executescript(f"""
+        PRAGMA query_only=1;
+        PRAGMA temp_store=MEMORY;
+        PRAGMA mmap_size=268435456;
+        PRAGMA cache_size=-{int(cache_mib) * 1024};
+    """)
+    conn.row_factory = sqlite3.Row
+    return conn
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Shared fixtures for the export script tests.
+
+Builds small SQLite databases for the exporters to read, runs each test
+class's export once into a temporary directory, and checks written files
+against the bytes json.dumps would have produced.
+
+Usage:
+    from tests.export_fixtures import ExportTestCase, build_fixture_db
+
+    class TestMyExport(ExportTestCase):
+        @classmethod
+        def run_export(cls, root):
+            ...
+"""
+
+import json
+import sqlite3
+import tempfile
+import unittest
+from pathlib import Path
+
+
+def build_fixture_db(path, schema, inserts=()):
+    """
+    Create a fixture database and return an open connection to it.
+
+    Args:
+        path: Database file path, or ':memory:'
+        schema: SQL script creating the tables (and any static rows)
+        inserts: (sql, rows) pairs, each run with executemany
+
+    Returns:
+        sqlite3.Connection: Committed connection returning sqlite3.Row rows
+    """
+    conn = sqlite3.connect(path)
+    conn.row_factory = sqlite3.Row
+    conn.executescript(schema)
+    for sql, rows in inserts:
+        conn.executemany(sql, rows)
+    conn.commit()
+    return conn
+
+
+# Legacy coins/series_metadata/composition_periods tables with one
+# Lincoln Wheat Cent series and its bronze composition period
+LEGACY_SCHEMA = '''
+    CREATE TABLE coins (country, denomination, series_id, coin_id, year, mint,
+                        business_strikes, proof_strikes, rarity, varieties,
+                        source_citation, notes);
+    CREATE TABLE series_metadata (series_id, series_name, official_name, start_year,
+                                  end_year, obverse_designer, reverse_designer,
+                                  diameter_mm, thickness_mm, edge_type);
+    CREATE TABLE composition_periods (series_id, start_year, end_year, alloy_name,
+                                      alloy_composition, weight_grams);
+    INSERT INTO series_metadata (series_id, series_name, start_year, end_year)
+        VALUES ('lincoln_wheat', 'Lincoln Wheat Cent', 1909, 1958);
+    INSERT INTO composition_periods VALUES
+        ('lincoln_wheat', 1909, 1942, 'Bronze', '{"copper": 0.95}', 3.11);
+'''
+
+
+def build_legacy_db(path, coins):
+    """
+    Create a legacy-schema fixture database of Philadelphia Lincoln Wheat cents.
+
+    Args:
+        path: Database file path, or ':memory:'
+        coins: (coin_id, year, varieties, notes) tuples
+
+    Returns:
+        sqlite3.Connection: Committed connection returning sqlite3.Row rows
+    """
+    return build_fixture_db(path, LEGACY_SCHEMA, [(
+        'INSERT INTO coins (country, denomination, series_id, coin_id, year, mint, varieties, notes) '
+        "VALUES ('US', 'Cents', 'lincoln_wheat', ?, ?, 'P', ?, ?)",
+        coins,
+    )])
+
+
+class ExportTestCase(unittest.TestCase):
+    """Base class for tests that run one export into a temporary directory."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Run the export once in a fresh temporary directory."""
+        cls.tmpdir = tempfile.TemporaryDirectory()
+        cls.root = Path(cls.tmpdir.name)
+        try:
+            cls.run_export(cls.root)
+        except BaseException:
+            cls.tmpdir.cleanup()
+            raise
+
+    @classmethod
+    def tearDownClass(cls):
+        """Remove the temporary directory."""
+        cls.tmpdir.cleanup()
+
+    @classmethod
+    def run_export(cls, root):
+        """Build the fixtures under root and run the export being tested."""
+        raise NotImplementedError
+
+    def assertMatchesJsonDump(self, raw, **dump_kwargs):
+        """
+        Assert raw is byte-for-byte what json.dumps wrote for its content.
+
+        dump_kwargs are passed to json.dumps and default to indent=2 with
+        ASCII \\u escapes, the default the exports must keep matching.
+        """
+        dump_kwargs.setdefault('indent', 2)
+        encoding = 'ascii' if dump_kwargs.get('ensure_ascii', True) else 'utf-8'
+        self.assertEqual(raw, json.dumps(json.loads(raw), **dump_kwargs).encode(encoding))
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+AI Taxonomy Export Tests
+
+Checks that the year-list and coin-ID formats rendered from a single
+database pass stay consistent with each other.
+
+Run: python -m pytest tests/test_ai_taxonomy_export.py -v
+"""
+
+import contextlib
+import gzip
+import importlib.util
+import io
+import json
+import unittest
+from pathlib import Path
+import sys
+
+# Add project root to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from scripts.export_ai_taxonomy import BINARY_FORMATS, AITaxonomyExporter
+from scripts.utils.taxonomy_validator import CANONICAL_DB_PATH
+from tests.export_fixtures import ExportTestCase
+
+
+class TestAITaxonomyExport(ExportTestCase):
+    """Test AI taxonomy series data and format rendering."""
+
+    @classmethod
+    def run_export(cls, root):
+        """Build series data once from the canonical database."""
+        if not CANONICAL_DB_PATH.exists():
+            raise unittest.SkipTest(f"Database not found at {CANONICAL_DB_PATH}")
+
+        cls.year_exporter = AITaxonomyExporter(
+            db_path=str(CANONICAL_DB_PATH), output_dir=str(root), use_year_lists=True)
+        cls.coinid_exporter = AITaxonomyExporter(
+            db_path=str(CANONICAL_DB_PATH), output_dir=str(root), use_year_lists=False)
+        cls.series_data = cls.year_exporter.build_series_data()
+
+    def test_series_data_not_empty(self):
+        """Series data should be built from the coins table."""
+        self.assertGreater(len(self.series_data), 0)
+
+    def test_formats_cover_same_series(self):
+        """Both formats must render the same series in the same order."""
+        years = self.year_exporter.render_series_records(self.series_data)
+        coin_ids = self.coinid_exporter.render_series_records(self.series_data)
+
+        self.assertEqual([r["series"] for r in years], [r["series"] for r in coin_ids])
+
+    def test_coverage_field_follows_total_years(self):
+        """The coverage field sits right after total_years in every record."""
+        for exporter, field in ((self.year_exporter, "years"), (self.coinid_exporter, "coin_ids")):
+            for record in exporter.render_series_records(self.series_data):
+                keys = list(record)
+                coverage = "years" if record.get("years") == "XXXX" else field
+                self.assertEqual(keys[keys.index("total_years") + 1], coverage, record["series"])
+
+    def test_year_list_matches_year_range(self):
+        """Year lists span exactly the advertised year range."""
+        for record in self.year_exporter.render_series_records(self.series_data):
+            if record["years"] == "XXXX":
+                self.assertEqual(record["total_years"], 0)
+                continue
+            years = record["years"].split(",")
+            self.assertEqual(len(years), record["total_years"], record["series"])
+            self.assertEqual(f"{years[0]}-{years[-1]}", record["year_range"])
+
+    def test_coin_ids_use_type_code(self):
+        """Generated coin IDs carry the series type code."""
+        for record in self.coinid_exporter.render_series_records(self.series_data):
+            if "coin_ids" not in record:
+                continue
+            first = record["coin_ids"].split(",", 1)[0]
+            self.assertTrue(first.startswith(f"US-{record['t']}-"), first)
+
+    def test_export_writes_file(self):
+        """Exporting with shared series data writes compact, \\u-escaped JSON."""
+        output_file, series_count = self.year_exporter.export_ai_taxonomy(self.series_data)
+
+        self.assertEqual(output_file.name, "us_taxonomy_year_list.json")
+        self.assertGreater(series_count, 0)
+        self.assertMatchesJsonDump(output_file.read_bytes(), indent=None, separators=(',', ':'))
+
+    def test_progress_lines_go_to_log(self):
+        """A log callable receives the progress lines instead of stdout."""
+        lines = []
+        stdout = io.StringIO()
+        with contextlib.redirect_stdout(stdout):
+            output_file, _ = self.coinid_exporter.export_ai_taxonomy(self.series_data, log=lines.append)
+
+        self.assertEqual(stdout.getvalue(), "")
+        self.assertTrue(lines[0].startswith("🤖 Exporting"))
+        self.assertIn(f"✅ AI-optimized taxonomy exported: {output_file}", lines)
+
+    def test_gzip_copy_matches_plain_file(self):
+        """The .json.gz sidecar decompresses to the plain JSON file."""
+        exporter = AITaxonomyExporter(
+            db_path=str(CANONICAL_DB_PATH), output_dir=str(self.root),
+            use_year_lists=False, write_gzip=True)
+        output_file, _ = exporter.export_ai_taxonomy(self.series_data)
+        gz_file = output_file.with_name(output_file.name + ".gz")
+
+        with gzip.open(gz_file, 'rb') as f:
+            self.assertEqual(f.read(), output_file.read_bytes())
+
+    def test_binary_copy_round_trips(self):
+        """Each binary copy decodes to the same document as the JSON file."""
+        for binary_format, (module_name, suffix) in BINARY_FORMATS.items():
+            with self.subTest(binary_format=binary_format):
+                if importlib.util.find_spec(module_name) is None:
+                    self.skipTest(f"{module_name} not installed")
+                codec = importlib.import_module(module_name)
+                exporter = AITaxonomyExporter(
+                    db_path=str(CANONICAL_DB_PATH), output_dir=str(self.root),
+                    use_year_lists=True, binary_format=binary_format)
+                output_file, _ = exporter.export_ai_taxonomy(self.series_data)
+
+                payload = output_file.with_suffix(suffix).read_bytes()
+                if binary_format == "cbor":
+                    decoded = codec.loads(payload)
+                else:
+                    decoded = codec.unpackb(payload, raw=False)
+                self.assertEqual(decoded, json.loads(output_file.read_bytes()))
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Canada Export Tests
+
+Runs the Canada exporter against a small fixture database and checks the
+universal issue records it writes.
+
+Run: python -m pytest tests/test_canada_export.py -v
+"""
+
+import contextlib
+import json
+import unittest
+from pathlib import Path
+import sys
+
+# Add project root to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from scripts.export_canada_from_database import COIN_COLUMNS, export_canada_coins
+from tests.export_fixtures import ExportTestCase, build_fixture_db
+
+# (coin_id, denomination, year, composition, varieties)
+FIXTURE_COINS = [
+    ('CA-MAPL-1988-P', 'Cents', 1988, '{"copper": 98.0, "zinc": 2.0}', '[{"name": "Doubled Die"}]'),
+    ('CA-MAPL-1989-P', 'Cents', 1989, 'null', 'null'),
+    ('CA-LOON-1990-P', 'Dollars', 1990, None, ''),
+]
+
+
+class TestCanadaExport(ExportTestCase):
+    """Test the Canada export against a fixture database."""
+
+    @classmethod
+    def run_export(cls, root):
+        """Build database/coins.db under root and run the export from there."""
+        (root / 'database').mkdir()
+        build_fixture_db(root / 'database' / 'coins.db',
+                         f"CREATE TABLE coins (country TEXT, {', '.join(COIN_COLUMNS)})", [(
+            'INSERT INTO coins (country, coin_id, series_id, denomination, series_name, '
+            'year, mint, composition, varieties, notes) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)',
+            [('CA', coin_id, coin_id[:7], denomination, 'Fixture Series', year, 'P',
+              composition, varieties, 'Gravure \u00e0 la feuille d\u2019\u00e9rable')
+             for coin_id, denomination, year, composition, varieties in FIXTURE_COINS],
+        )]).close()
+
+        with contextlib.chdir(root):
+            export_canada_coins()
+
+        cls.raw_files = {
+            path: (root / path).read_bytes()
+            for path in ('data/ca/ca_coins_complete.json', 'data/ca/coins/ca_cents.json',
+                         'data/universal/ca_issues.json')
+        }
+        universal = json.loads(cls.raw_files['data/universal/ca_issues.json'])
+        cls.issues = {issue['issueId']: issue for issue in universal['issues']}
+
+    def test_every_coin_becomes_an_issue(self):
+        """Each Canada coin in the database yields one universal issue."""
+        self.assertEqual(sorted(self.issues), sorted(coin[0] for coin in FIXTURE_COINS))
+
+    def test_json_columns_are_decoded(self):
+        """Stored composition and varieties JSON is decoded into the issue."""
+        issue = self.issues['CA-MAPL-1988-P']
+        self.assertEqual(issue['composition'], {'copper': 98.0, 'zinc': 2.0})
+        self.assertEqual(issue['varieties'], [{'name': 'Doubled Die'}])
+
+    def test_null_json_columns_use_empty_defaults(self):
+        """A stored JSON null falls back to the empty composition and varieties."""
+        for coin_id in ('CA-MAPL-1989-P', 'CA-LOON-1990-P'):
+            issue = self.issues[coin_id]
+            self.assertEqual(issue['composition'], {})
+            self.assertEqual(issue['varieties'], [])
+
+    def test_files_match_json_dump(self):
+        """Files are byte-for-byte what json.dump(indent=2) wrote."""
+        for path, raw in self.raw_files.items():
+            with self.subTest(path=path):
+                self.assertMatchesJsonDump(raw)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Legacy Database Export Tests
+
+Runs export_db.export_to_json against a small fixture database and checks
+the per-denomination files it writes.
+
+Run: python -m pytest tests/test_export_db.py -v
+"""
+
+import json
+import unittest
+from pathlib import Path
+import sys
+
+# Add project root to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from scripts.export_db import export_to_json
+from tests.export_fixtures import ExportTestCase, build_legacy_db
+
+# (coin_id, year, varieties)
+FIXTURE_COINS = [
+    ('US-LWC-1909-P', 1909, '[{"name": "VDB"}]'),
+    ('US-LWC-1910-P', 1910, 'null'),
+    ('US-LWC-1911-P', 1911, 'not json'),
+    ('US-LWC-1912-P', 1912, None),
+]
+
+
+class TestExportToJson(ExportTestCase):
+    """Test export_to_json against a fixture database."""
+
+    @classmethod
+    def run_export(cls, root):
+        """Build the fixture database and run the export."""
+        build_legacy_db(root / 'coins.db', [
+            (coin_id, year, varieties, 'Brenner \u2605 Gravure') for coin_id, year, varieties in FIXTURE_COINS
+        ]).close()
+
+        export_to_json(str(root / 'coins.db'), str(root / 'data'))
+        cls.raw = (root / 'data' / 'us' / 'coins' / 'cents.json').read_bytes()
+        cls.cents = json.loads(cls.raw)
+
+    def test_series_structure(self):
+        """Coins are nested under their series with its composition periods."""
+        series = self.cents['series'][0]
+        self.assertEqual(series['series_id'], 'lincoln_wheat')
+        self.assertEqual(series['composition_periods'][0]['alloy'], {'copper': 0.95})
+        self.assertEqual([coin['coin_id'] for coin in series['coins']],
+                         [coin[0] for coin in FIXTURE_COINS])
+
+    def test_varieties_follow_stored_json(self):
+        """Stored JSON (including null) is kept; malformed or missing values are left out."""
+        coins = {coin['coin_id']: coin for coin in self.cents['series'][0]['coins']}
+        self.assertEqual(coins['US-LWC-1909-P']['varieties'], [{'name': 'VDB'}])
+        self.assertIn('varieties', coins['US-LWC-1910-P'])
+        self.assertIsNone(coins['US-LWC-1910-P']['varieties'])
+        self.assertNotIn('varieties', coins['US-LWC-1911-P'])
+        self.assertNotIn('varieties', coins['US-LWC-1912-P'])
+
+    def test_file_matches_json_dump(self):
+        """The file is byte-for-byte what json.dump(indent=2) wrote, \\u escapes included."""
+        self.assertMatchesJsonDump(self.raw)
+        self.assertEqual(self.cents['series'][0]['coins'][0]['notes'], 'Brenner \u2605 Gravure')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""
+Universal Export v1.1 Tests
+
+Runs the v1.1 universal issue and legacy exports against in-memory fixture
+databases and checks the files they write.
+
+Run: python -m pytest tests/test_export_db_v1_1.py -v
+"""
+
+import io
+import json
+import os
+import tarfile
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+import sys
+
+# Add project root to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from scripts import export_db_v1_1
+from scripts.export_db_v1_1 import export_issues_by_country, export_legacy_format
+from tests.export_fixtures import ExportTestCase, build_fixture_db, build_legacy_db
+
+ISSUE_COLUMNS = (
+    'issue_id', 'object_type', 'series_id', 'series_group', 'series_group_years',
+    'country_code', 'authority_name', 'monetary_system', 'currency_unit',
+    'face_value', 'unit_name', 'common_names', 'system_fraction', 'issue_year',
+    'mint_id', 'date_range_start', 'date_range_end', 'specifications', 'sides',
+    'mintage', 'rarity', 'varieties', 'source_citation', 'notes'
+)
+
+# (issue_id, country_code, issue_year, specifications, varieties)
+FIXTURE_ISSUES = [
+    ('US-LWC-1909-P', 'US', 1909, '{"weight_grams": 3.11}', '[{"name": "VDB"}]'),
+    ('US-LWC-1910-P', 'US', 1910, 'null', 'not json'),
+    ('CA-MAPL-1988-P', 'CA', 1988, None, ''),
+]
+
+
+def build_issues_db():
+    """Return an in-memory connection holding FIXTURE_ISSUES."""
+    return build_fixture_db(':memory:', f"CREATE TABLE issues ({', '.join(ISSUE_COLUMNS)})", [(
+        'INSERT INTO issues (issue_id, object_type, series_id, country_code, face_value, '
+        'issue_year, specifications, varieties, notes) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)',
+        [(issue_id, 'coin', issue_id[:6], country, 0.01, year, specifications, varieties,
+          'Grav\u00e9 par Brenner \u2605')
+         for issue_id, country, year, specifications, varieties in FIXTURE_ISSUES],
+    )])
+
+
+# (coin_id, year, varieties)
+FIXTURE_LEGACY_COINS = [
+    ('US-LWC-1909-P', 1909, '[{"name": "VDB"}]'),
+    ('US-LWC-1910-P', 1910, 'null'),
+    ('US-LWC-1911-P', 1911, 'not json'),
+    ('US-LWC-1912-P', 1912, ''),
+]
+
+
+def build_legacy_coins_db():
+    """Return an in-memory legacy database holding FIXTURE_LEGACY_COINS."""
+    return build_legacy_db(':memory:', [coin + (None,) for coin in FIXTURE_LEGACY_COINS])
+
+
+class TestUniversalIssueExport(ExportTestCase):
+    """Test the per-country universal issue files."""
+
+    @classmethod
+    def run_export(cls, root):
+        """Export the fixture issues inside a read transaction, as main() does."""
+        conn = build_issues_db()
+        conn.execute('BEGIN DEFERRED')
+        cls.country_counts = export_issues_by_country(conn, str(root))
+        conn.rollback()
+        conn.close()
+
+    def load(self, country):
+        """Load one country's exported issue file."""
+        with open(self.root / f"{country.lower()}_issues.json") as f:
+            return json.load(f)
+
+    def test_in_memory_database_exports_every_country(self):
+        """Counts and files come from the connection passed in."""
+        self.assertEqual([tuple(row) for row in self.country_counts], [('CA', 1), ('US', 2)])
+        for country, count in self.country_counts:
+            data = self.load(country)
+            self.assertEqual(data['total_issues'], count)
+            self.assertEqual(len(data['issues']), count)
+
+    def test_null_and_malformed_json_use_defaults(self):
+        """Null, empty and malformed JSON columns fall back to empty values."""
+        issues = {issue['issue_id']: issue for issue in self.load('US')['issues']}
+        self.assertEqual(issues['US-LWC-1909-P']['varieties'], [{'name': 'VDB'}])
+        self.assertEqual(issues['US-LWC-1910-P']['varieties'], [])
+        self.assertEqual(self.load('CA')['issues'][0]['specifications'], {})
+
+    def test_non_ascii_is_escaped(self):
+        """Files are byte-for-byte what json.dump(indent=2) wrote, \\u escapes included."""
+        raw = (self.root / 'us_issues.json').read_bytes()
+        self.assertMatchesJsonDump(raw)
+        self.assertIn(b'Grav\\u00e9 par Brenner \\u2605', raw)
+        self.assertEqual(self.load('US')['issues'][0]['notes'], 'Grav\u00e9 par Brenner \u2605')
+
+
+class TestLegacyExport(ExportTestCase):
+    """Test the legacy per-denomination files."""
+
+    @classmethod
+    def run_export(cls, root):
+        """Export the fixture coins."""
+        conn = build_legacy_coins_db()
+        export_legacy_format(conn, str(root))
+        conn.close()
+        with open(root / 'us' / 'coins' / 'cents.json') as f:
+            cls.cents = json.load(f)
+
+    def test_varieties_follow_stored_json(self):
+        """Stored JSON (including null) is kept; empty or malformed values are left out."""
+        coins = {coin['coin_id']: coin for coin in self.cents['series'][0]['coins']}
+        self.assertEqual(coins['US-LWC-1909-P']['varieties'], [{'name': 'VDB'}])
+        self.assertIn('varieties', coins['US-LWC-1910-P'])
+        self.assertIsNone(coins['US-LWC-1910-P']['varieties'])
+        self.assertNotIn('varieties', coins['US-LWC-1911-P'])
+        self.assertNotIn('varieties', coins['US-LWC-1912-P'])
+
+
+
+@unittest.skipIf(export_db_v1_1.zstandard is None, "zstandard not installed")
+class TestLegacyBundle(unittest.TestCase):
+    """Test the --bundle legacy archive."""
+
+    def setUp(self):
+        """Create a temporary output directory."""
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.bundle_path = Path(self.tmpdir.name) / 'legacy.tar.zst'
+
+    def tearDown(self):
+        """Remove the temporary output directory."""
+        self.tmpdir.cleanup()
+
+    def test_bundle_holds_the_legacy_files(self):
+        """The archive holds the same document the directory tree would."""
+        conn = build_legacy_coins_db()
+        export_legacy_format(conn, self.tmpdir.name, bundle=True)
+        conn.close()
+        self.assertEqual(os.listdir(self.tmpdir.name), ['legacy.tar.zst'])
+
+        with open(self.bundle_path, 'rb') as f:
+            data = export_db_v1_1.zstandard.ZstdDecompressor().stream_reader(f).read()
+        with tarfile.open(fileobj=io.BytesIO(data)) as tar:
+            self.assertEqual(tar.getnames(), ['us/coins/cents.json'])
+            cents = json.load(tar.extractfile('us/coins/cents.json'))
+        self.assertEqual([coin['coin_id'] for coin in cents['series'][0]['coins']],
+                         [coin[0] for coin in FIXTURE_LEGACY_COINS])
+
+    def test_failed_bundle_is_removed(self):
+        """An error while bundling leaves no partial archive behind."""
+        conn = build_legacy_coins_db()
+        with mock.patch.object(export_db_v1_1, '_json_bytes', side_effect=OSError('disk full')):
+            with self.assertRaises(OSError):
+                export_legacy_format(conn, self.tmpdir.name, bundle=True)
+        conn.close()
+        self.assertFalse(self.bundle_path.exists())
+
+
+if __name__ == '__main__':
+    unittest.main()
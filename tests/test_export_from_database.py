@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Database-First Export Tests
+
+Runs the denomination and complete-file steps of export_from_database.py
+against a small fixture database, including NULL and malformed composition
+rows, and checks the files match what json.dump used to write.
+
+Run: python -m pytest tests/test_export_from_database.py -v
+"""
+
+import contextlib
+import json
+import unittest
+from pathlib import Path
+import sys
+
+# Add project root and scripts to path for imports (the exporter imports
+# json_validator as a sibling module)
+sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent.parent / 'scripts'))
+
+try:
+    from scripts.export_from_database import DatabaseExporter
+except ImportError as e:  # jsonschema is needed by json_validator
+    raise unittest.SkipTest(f"export_from_database unavailable: {e}")
+from tests.export_fixtures import ExportTestCase, build_fixture_db
+
+COIN_COLUMNS = (
+    'coin_id', 'series', 'denomination', 'year', 'mint', 'business_strikes',
+    'proof_strikes', 'total_mintage', 'rarity', 'composition', 'weight_grams',
+    'diameter_mm', 'variety', 'source_citation', 'notes', 'obverse_description',
+    'reverse_description', 'designer'
+)
+
+# (coin_id, series, year, composition, variety)
+FIXTURE_COINS = [
+    ('US-IHC-1877-P', 'Indian Head Cent', '1877', None, None),
+    ('US-LWC-1909-P', 'Lincoln Wheat Cent', '1909', '{"copper": 95, "tin": 5}', 'VDB'),
+    ('US-LWC-1910-P', 'Lincoln Wheat Cent', '1910', 'null', None),
+    ('US-LWC-1911-S', 'Lincoln Wheat Cent', '1911', '95% Cu, 5% Sn', '  '),
+    ('US-LWC-1912-D', 'Lincoln Wheat Cent', '1912', '{"copper": 95', None),
+]
+
+
+class TestDatabaseExporter(ExportTestCase):
+    """Test the denomination and complete-file exports."""
+
+    @classmethod
+    def run_export(cls, root):
+        """Build database/coins.db under root and run both export steps from there."""
+        (root / 'database').mkdir()
+        build_fixture_db(root / 'database' / 'coins.db', f'''
+            CREATE TABLE coins ({', '.join(COIN_COLUMNS)});
+            CREATE TABLE series_registry (series_name, denomination, aliases);
+            INSERT INTO series_registry VALUES
+                ('Lincoln Wheat Cent', 'Cents', '["Wheat Penny"]'),
+                ('Lincoln Wheat Cent', 'Cents', '["Shadowed"]'),
+                ('Indian Head Cent', 'Cents', 'not json');
+        ''', [(
+            'INSERT INTO coins (coin_id, series, denomination, year, mint, business_strikes, '
+            'composition, variety, notes) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)',
+            [(coin_id, series, 'Cents', year, coin_id[-1], 1000, composition, variety, 'Brenner ★')
+             for coin_id, series, year, composition, variety in FIXTURE_COINS],
+        )]).close()
+
+        with contextlib.chdir(root):
+            exporter = DatabaseExporter(ndjson=True)
+            exporter.ensure_output_dir()
+            exporter.export_coins_by_denomination()
+            exporter.export_complete_file()
+
+        cls.cents_raw = (root / 'data' / 'us' / 'coins' / 'cents.json').read_bytes()
+        cls.cents = json.loads(cls.cents_raw)
+        cls.complete_raw = (root / 'data' / 'us' / 'us_coins_complete.json').read_bytes()
+        cls.complete = json.loads(cls.complete_raw)
+        with open(root / 'data' / 'us' / 'us_coins_complete_rows.ndjson') as f:
+            cls.rows = [json.loads(line) for line in f]
+
+    def test_files_match_json_dump(self):
+        """Both files are byte-for-byte what json.dump(sort_keys=True) wrote."""
+        for raw in (self.cents_raw, self.complete_raw):
+            self.assertMatchesJsonDump(raw, ensure_ascii=False, sort_keys=True)
+
+    def test_composition_parsing(self):
+        """JSON, text, null, missing and malformed compositions all export."""
+        coins = {coin['coin_id']: coin for coin in self.complete['coins']}
+        self.assertEqual(coins['US-LWC-1909-P']['composition'], {'copper': 95, 'tin': 5})
+        self.assertEqual(coins['US-LWC-1911-S']['composition'], {'copper': 95.0, 'tin': 5.0})
+        self.assertIsNone(coins['US-LWC-1910-P']['composition'])
+        self.assertEqual(coins['US-IHC-1877-P']['composition'], {})
+        self.assertEqual(coins['US-LWC-1912-D']['composition'], {})
+
+    def test_series_use_first_registry_aliases(self):
+        """The first registry row wins, and unparseable aliases are skipped."""
+        series = {entry['series_id']: entry for entry in self.cents['series']}
+        self.assertEqual(series['Lincoln Wheat Cent']['aliases'], ['Wheat Penny'])
+        self.assertNotIn('aliases', series['Indian Head Cent'])
+
+    def test_ndjson_rows_match_complete_file(self):
+        """Each NDJSON line is one entry of the complete file's coins array."""
+        self.assertEqual(self.rows, self.complete['coins'])
+        self.assertEqual(self.complete['total_coins'], len(FIXTURE_COINS))
+
+
+if __name__ == '__main__':
+    unittest.main()
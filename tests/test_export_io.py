@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Export I/O Helper Tests
+
+Checks that dumps_ascii writes the same bytes json.dumps does by default,
+and that open_readonly refuses writes.
+
+Run: python -m pytest tests/test_export_io.py -v
+"""
+
+import json
+import sqlite3
+import tempfile
+import unittest
+from pathlib import Path
+import sys
+
+# Add project root to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from scripts.utils.export_io import dumps_ascii, open_readonly
+
+FIXTURE = {
+    'notes': 'Gravé par Brenner ★',
+    'symbol': '\U0001F4B0',
+    'control': 'tab\there, del\x7f',
+    'values': [0.01, 1909, None, True],
+}
+
+
+class TestDumpsAscii(unittest.TestCase):
+    """Test dumps_ascii against the stdlib encoder."""
+
+    def test_pretty_matches_json_dumps(self):
+        """Indented output is byte-for-byte json.dumps(indent=2), surrogate pairs included."""
+        self.assertEqual(dumps_ascii(FIXTURE), json.dumps(FIXTURE, indent=2).encode('ascii'))
+
+    def test_compact_matches_json_dumps(self):
+        """Compact output is byte-for-byte json.dumps with tight separators."""
+        self.assertEqual(dumps_ascii(FIXTURE, pretty=False),
+                         json.dumps(FIXTURE, separators=(',', ':')).encode('ascii'))
+
+
+class TestOpenReadonly(unittest.TestCase):
+    """Test the read-only export connection."""
+
+    def test_reads_rows_and_rejects_writes(self):
+        """Rows come back as sqlite3.Row and writes raise."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db_path = Path(tmpdir) / 'coins.db'
+            conn = sqlite3.connect(db_path)
+            conn.execute("CREATE TABLE coins (coin_id)")
+            conn.execute("INSERT INTO coins VALUES ('US-LWC-1909-P')")
+            conn.commit()
+            conn.close()
+
+            conn = open_readonly(db_path)
+            try:
+                self.assertEqual(conn.execute('SELECT coin_id FROM coins').fetchone()['coin_id'],
+                                 'US-LWC-1909-P')
+                with self.assertRaises(sqlite3.OperationalError):
+                    conn.execute("INSERT INTO coins VALUES ('US-LWC-1910-P')")
+            finally:
+                conn.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
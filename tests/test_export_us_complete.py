@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Complete US Taxonomy Export Tests
+
+Runs export_us_complete.py against a small fixture data tree and checks the
+JSON and NDJSON outputs.
+
+Run: python -m pytest tests/test_export_us_complete.py -v
+"""
+
+import contextlib
+import json
+import unittest
+from pathlib import Path
+import sys
+
+# Add project root to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from scripts.export_us_complete import export_complete_us_taxonomy
+from tests.export_fixtures import ExportTestCase
+
+FIXTURE_CENTS = {
+    'country': 'US',
+    'denomination': 'Cents',
+    'face_value': 0.01,
+    'series': [{
+        'series_id': 'lincoln_wheat',
+        'series_name': 'Lincoln Wheat Cent',
+        'composition_periods': [
+            {'date_range': {'start': 1909, 'end': 1942}, 'composition_key': 'bronze',
+             'weight': {'grams': 3.11}},
+            {'date_range': {'start': 1943, 'end': 1943}, 'alloy_name': 'Zinc-coated steel'},
+        ],
+        'coins': [
+            {'coin_id': 'US-LWC-1909-P', 'year': 1909, 'mint': 'P', 'varieties': None,
+             'notes': 'Brenner ★'},
+            {'coin_id': 'US-LWC-1943-S', 'year': 1943, 'mint': 'S', 'varieties': []},
+        ],
+    }],
+}
+
+FIXTURE_COMPOSITIONS = {
+    'common_alloys': {
+        'bronze': {'name': 'Bronze', 'composition': {'copper': 0.95, 'tin_zinc': 0.05}},
+    },
+}
+
+
+class TestExportUSComplete(ExportTestCase):
+    """Test the complete taxonomy export in both formats."""
+
+    @classmethod
+    def run_export(cls, root):
+        """Build the fixture data tree and export it as JSON and NDJSON."""
+        (root / 'data' / 'us' / 'coins').mkdir(parents=True)
+        (root / 'data' / 'us' / 'references').mkdir()
+        (root / 'data' / 'us' / 'coins' / 'cents.json').write_text(json.dumps(FIXTURE_CENTS))
+        (root / 'data' / 'us' / 'references' / 'compositions.json').write_text(
+            json.dumps(FIXTURE_COMPOSITIONS))
+
+        with contextlib.chdir(root):
+            export_complete_us_taxonomy()
+            export_complete_us_taxonomy(ndjson=True)
+
+        cls.raw = (root / 'data' / 'us' / 'us_coins_complete.json').read_bytes()
+        cls.complete = json.loads(cls.raw)
+        with open(root / 'data' / 'us' / 'us_coins_complete.ndjson') as f:
+            cls.lines = [json.loads(line) for line in f]
+        with open(root / 'data' / 'us' / 'us_coins_complete_meta.json') as f:
+            cls.meta = json.load(f)
+
+    def test_file_matches_json_dump(self):
+        """The JSON file is byte-for-byte what json.dump(indent=2) wrote."""
+        self.assertMatchesJsonDump(self.raw)
+
+    def test_composition_keys_are_resolved(self):
+        """Periods with a composition_key are expanded; others pass through."""
+        periods = self.complete['denominations']['Cents']['series'][0]['composition_periods']
+        self.assertEqual(periods[0]['alloy_name'], 'Bronze')
+        self.assertEqual(periods[0]['alloy'], {'copper': 0.95, 'tin_zinc': 0.05})
+        self.assertEqual(periods[1], FIXTURE_CENTS['series'][0]['composition_periods'][1])
+
+    def test_ndjson_lines_carry_their_series(self):
+        """Each NDJSON line is a coin tagged with its denomination and series."""
+        expected = [
+            {'denomination': 'Cents', 'series_id': 'lincoln_wheat', **coin}
+            for coin in FIXTURE_CENTS['series'][0]['coins']
+        ]
+        self.assertEqual(self.lines, expected)
+        self.assertNotIn('coins', self.meta['denominations']['Cents']['series'][0])
+        self.assertEqual(self.meta['statistics']['total_coins'], 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+JSON Validator Tests
+
+Checks that JSONValidator writes the same bytes json.dump(sort_keys=True)
+used to, whether a document is written whole or streamed, and that bad
+input is reported instead of written.
+
+Run: python -m pytest tests/test_json_validator.py -v
+"""
+
+import json
+import tempfile
+import unittest
+from pathlib import Path
+import sys
+
+# Add project root to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+try:
+    from scripts.json_validator import JSONValidator
+except ImportError as e:  # jsonschema is a hard dependency of the module
+    raise unittest.SkipTest(f"json_validator unavailable: {e}")
+
+FIXTURE_COINS = [
+    {'coin_id': 'US-LWC-1909-P', 'composition': {'copper': 95, 'tin': 5}, 'notes': 'Brenner ★'},
+    {'coin_id': 'US-LWC-1910-P', 'composition': None, 'varieties': []},
+    {'coin_id': 'US-LWC-1911-S', 'weight_grams': 3.11, 'varieties': [{'name': 'S/S'}]},
+]
+
+
+def dump_sorted(data):
+    """Bytes json.dump(indent=2, ensure_ascii=False, sort_keys=True) wrote."""
+    return json.dumps(data, indent=2, ensure_ascii=False, sort_keys=True).encode('utf-8')
+
+
+class TestJSONValidator(unittest.TestCase):
+    """Test JSONValidator's writers."""
+
+    def setUp(self):
+        """Give each test its own output directory."""
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.output_dir = Path(self.tmpdir.name)
+        self.validator = JSONValidator()
+
+    def tearDown(self):
+        """Remove the output directory."""
+        self.tmpdir.cleanup()
+
+    def test_write_matches_json_dump(self):
+        """safe_json_write output is what json.dump(sort_keys=True) wrote."""
+        data = {'total_coins': 3, 'coins': FIXTURE_COINS, 'country': 'US'}
+        filepath = self.output_dir / 'complete.json'
+
+        self.assertTrue(self.validator.safe_json_write(data, filepath))
+        self.assertEqual(filepath.read_bytes(), dump_sorted(data))
+
+    def test_stream_matches_whole_write(self):
+        """Streaming the coins list yields the same bytes as writing it whole."""
+        for coins in (FIXTURE_COINS, []):
+            with self.subTest(coins=len(coins)):
+                data = {'total_coins': len(coins), 'year_range': {'earliest': 1909, 'latest': 1911}}
+                filepath = self.output_dir / 'streamed.json'
+
+                self.assertTrue(self.validator.safe_json_write_stream(data, 'coins', iter(coins), filepath))
+                self.assertEqual(filepath.read_bytes(), dump_sorted(dict(data, coins=coins)))
+
+    def test_stream_rejects_coin_without_id(self):
+        """A coin without coin_id fails the write and leaves no file behind."""
+        filepath = self.output_dir / 'bad.json'
+        coins = FIXTURE_COINS + [{'year': 1912}]
+
+        self.assertFalse(self.validator.safe_json_write_stream({}, 'coins', coins, filepath))
+        self.assertFalse(filepath.exists())
+        self.assertFalse(filepath.with_suffix('.tmp').exists())
+        self.assertTrue(self.validator.get_errors())
+
+    def test_unserializable_data_is_reported(self):
+        """Data that cannot be encoded is reported, not written."""
+        filepath = self.output_dir / 'bad.json'
+
+        self.assertFalse(self.validator.safe_json_write({'coins': [{'coin_id': object()}]}, filepath))
+        self.assertFalse(filepath.exists())
+        self.assertTrue(self.validator.get_errors())
+
+    def test_malformed_file_fails_validation(self):
+        """validate_json_file accepts valid JSON and rejects truncated JSON."""
+        valid = self.output_dir / 'valid.json'
+        valid.write_bytes(dump_sorted({'coins': FIXTURE_COINS}))
+        truncated = self.output_dir / 'truncated.json'
+        truncated.write_bytes(b'{"coins": [')
+
+        self.assertTrue(self.validator.validate_json_file(valid))
+        self.assertFalse(self.validator.validate_json_file(truncated))
+
+
+if __name__ == '__main__':
+    unittest.main()